@@ -2,12 +2,14 @@
 Build script for creating the Jellyfin Music Organizer executable.
 """
 
+import compileall
+import hashlib
 import logging
 import os
 import shutil
-import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 # Define resource paths
 ICON_PATH = os.path.join("jellyfin_music_organizer", "resources", "Octopus.ico")
@@ -16,6 +18,102 @@ BUILD_DIR = "dist"
 
 logger = logging.getLogger(__name__)
 
+_SPEC_TEMPLATE = """\
+# -*- mode: python ; coding: utf-8 -*-
+
+block_cipher = None
+
+a = Analysis(['{entry_point}'],
+    pathex=[],
+    binaries=[],
+    datas={datas},
+    hiddenimports=[],
+    hookspath=[],
+    runtime_hooks=[],
+    excludes=[],
+    win_no_prefer_redirects=False,
+    win_private_assemblies=False,
+    cipher=block_cipher,
+    noarchive=False)
+"""
+
+# Directory entries gathered in one scandir pass, keyed by _cache_key() of the relative path
+_stat_cache: Optional[Dict[str, "os.DirEntry[str]"]] = None
+
+
+def _cache_key(path: str) -> str:
+    """Normalize a path the way the filesystem compares it."""
+    return os.path.normcase(os.path.normpath(path))
+
+
+def _scan_into(cache: Dict[str, "os.DirEntry[str]"], directory: str, recursive: bool) -> None:
+    """Record every entry below a directory in the stat cache."""
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                path = os.path.join(directory, entry.name)
+                cache[_cache_key(path)] = entry
+                if recursive and entry.is_dir(follow_symlinks=False):
+                    _scan_into(cache, path, recursive)
+    except FileNotFoundError:
+        pass
+
+
+def _scan_directory(directory: str, recursive: bool) -> Dict[str, "os.DirEntry[str]"]:
+    """Scan a single directory into a fresh cache fragment."""
+    cache: Dict[str, "os.DirEntry[str]"] = {}
+    _scan_into(cache, directory, recursive)
+    return cache
+
+
+def _get_stat_cache() -> Dict[str, "os.DirEntry[str]"]:
+    """Scan the project root and resource directories once per build.
+
+    The directories are scanned concurrently; scandir releases the GIL, so
+    latency on slow or network-mounted trees overlaps.
+    """
+    global _stat_cache
+    if _stat_cache is None:
+        targets = [
+            (".", False),
+            (NOTIFICATION_AUDIO_DIR, True),
+            (os.path.dirname(ICON_PATH), True),
+        ]
+        cache: Dict[str, "os.DirEntry[str]"] = {}
+        with ThreadPoolExecutor(max_workers=len(targets)) as executor:
+            for fragment in executor.map(lambda target: _scan_directory(*target), targets):
+                cache.update(fragment)
+        _stat_cache = cache
+    return _stat_cache
+
+
+def _exists(path: str) -> bool:
+    """Check whether a project path exists using the stat cache."""
+    return _cache_key(path) in _get_stat_cache()
+
+
+def find_duplicate_sources(root: str = "jellyfin_music_organizer") -> List[List[str]]:
+    """Find Python modules with byte-identical content below a directory.
+
+    Duplicate modules end up in the bundle twice and are analyzed twice by
+    PyInstaller. Empty files (such as bare ``__init__.py``) are ignored.
+
+    Returns:
+        Groups of paths that share the same content
+    """
+    by_digest: Dict[str, List[str]] = {}
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d != "__pycache__"]
+        for filename in filenames:
+            if not filename.endswith(".py"):
+                continue
+            path = os.path.join(dirpath, filename)
+            with open(path, "rb") as f:
+                content = f.read()
+            if content.strip():
+                by_digest.setdefault(hashlib.sha256(content).hexdigest(), []).append(path)
+    return [sorted(paths) for paths in by_digest.values() if len(paths) > 1]
+
 
 def ensure_resources_exist():
     """Ensure all required resource files exist."""
@@ -27,12 +125,19 @@ def ensure_resources_exist():
 
     missing_files = []
     for file_path, description in required_files:
-        if not os.path.exists(file_path):
+        if not _exists(file_path):
             missing_files.append(f"- {description}: {file_path}")
 
     if missing_files:
-        print("Error: Required resource files are missing:")
-        print("\n".join(missing_files))
+        logger.error("Required resource files are missing:\n%s", "\n".join(missing_files))
+        return False
+
+    duplicates = find_duplicate_sources()
+    if duplicates:
+        logger.error(
+            "Duplicate source files would be bundled twice:\n%s",
+            "\n".join(f"- {', '.join(group)}" for group in duplicates),
+        )
         return False
 
     return True
@@ -62,7 +167,7 @@ def get_pyinstaller_args():
     # Add optional files if they exist
     optional_files = ["config.json", "README.md", "LICENSE"]
     for file in optional_files:
-        if os.path.exists(file):
+        if _exists(file):
             args.append(f"--add-data={file};.")
         else:
             print(f"Note: Optional file '{file}' not found, skipping...")
@@ -79,15 +184,45 @@ def build_executable():
     # Get PyInstaller arguments
     get_pyinstaller_args()
 
-    # Run PyInstaller
+    # Run PyInstaller in-process; imported here so failed preconditions skip its import cost
+    import PyInstaller.__main__
+
+    # Byte-compile the package on all CPUs so PyInstaller's analysis reuses the .pyc files
+    print("Compiling package bytecode...")
+    compileall.compile_dir("jellyfin_music_organizer", quiet=1, workers=0)
+
     print("Starting PyInstaller build...")
-    pyinstaller_cmd = [
-        "pyinstaller",
+    pyinstaller_args = [
         "--onefile",
         "--windowed",
         "--icon=resources/icons/Octopus.ico",
     ]
-    subprocess.run(pyinstaller_cmd + ["main.py"])
+    PyInstaller.__main__.run(pyinstaller_args + ["main.py"])
+
+
+def _copytree_if_newer(src: str, dst: str) -> int:
+    """Copy a directory tree, skipping files whose destination copy is up to date.
+
+    Returns:
+        Number of files actually copied
+    """
+    os.makedirs(dst, exist_ok=True)
+    copied = 0
+    with os.scandir(src) as it:
+        for entry in it:
+            target = os.path.join(dst, entry.name)
+            if entry.is_dir(follow_symlinks=False):
+                copied += _copytree_if_newer(entry.path, target)
+                continue
+            try:
+                if os.stat(target).st_mtime_ns >= entry.stat().st_mtime_ns:
+                    continue
+            except FileNotFoundError:
+                pass
+            # copy2 preserves mtime so the next build can skip this file
+            shutil.copy2(entry.path, target)
+            copied += 1
+    return copied
 
 
 def copy_additional_files():
@@ -97,8 +232,8 @@ def copy_additional_files():
 
     # Copy documentation if it exists
     if os.path.exists("docs"):
-        shutil.copytree("docs", os.path.join(BUILD_DIR, "docs"), dirs_exist_ok=True)
-        print("Documentation copied successfully")
+        copied = _copytree_if_newer("docs", os.path.join(BUILD_DIR, "docs"))
+        print(f"Documentation copied successfully ({copied} file(s) updated)")
 
 
 def create_spec_file(
@@ -111,30 +246,15 @@ def create_spec_file(
             raise ValueError("Missing required parameters")
 
         # Create spec file content
-        spec_content = (
-            f"# -*- mode: python ; coding: utf-8 -*-\n\n"
-            f"block_cipher = None\n\n"
-            f"a = Analysis(['{entry_point}'],\n"
-            f"    pathex=[],\n"
-            f"    binaries=[],\n"
-            f"    datas={additional_data},\n"
-            f"    hiddenimports=[],\n"
-            f"    hookspath=[],\n"
-            f"    runtime_hooks=[],\n"
-            f"    excludes=[],\n"
-            f"    win_no_prefer_redirects=False,\n"
-            f"    win_private_assemblies=False,\n"
-            f"    cipher=block_cipher,\n"
-            f"    noarchive=False)\n"
-        )
+        spec_content = _SPEC_TEMPLATE.format(entry_point=entry_point, datas=additional_data)
 
         # Write spec file
         spec_path = Path(f"{name}.spec")
-        spec_path.write_text(spec_content, encoding="utf-8")
+        spec_path.write_bytes(spec_content.encode("utf-8"))
         logger.info(f"Created spec file: {spec_path}")
 
     except Exception as e:
-        logger.error(f"Failed to create spec file: {e}")
+        logger.error("Failed to create spec file: %s", e)
         raise
 
 
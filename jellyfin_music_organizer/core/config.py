@@ -2,16 +2,57 @@
 Configuration management for the Jellyfin Music Organizer.
 """
 
-import json
+import atexit
 import logging
-from dataclasses import dataclass, field
+import os
+import sys
+import tempfile
+import threading
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional, Set
+
+from PyQt5.QtCore import QCoreApplication, QThread, QTimer
+
+from ..utils import json_compat
 
 logger = logging.getLogger(__name__)
 
+# Delay used to coalesce bursts of set() calls into a single write
+SAVE_DEBOUNCE_MS = 300
+
+# Config directories already created during this process
+_ENSURED_DIRS: Set[Path] = set()
+
+# Managers with a deferred save not yet written; held only until that save runs
+_PENDING_SAVES: Set["ConfigManager"] = set()
+
+# Values that can't change in place, so an equal value means there is nothing to save
+_IMMUTABLE_TYPES = (str, bool, int, float, type(None))
+
+
+def _flush_pending_saves() -> None:
+    """Write every deferred configuration save before the interpreter exits."""
+    for manager in list(_PENDING_SAVES):
+        manager._flush()
+
 
-@dataclass
+atexit.register(_flush_pending_saves)
+
+
+@lru_cache(maxsize=1)
+def _default_config_path() -> Path:
+    """Resolve the default config file location once per process."""
+    return Path.home() / ".jellyfin_music_organizer" / "config.json"
+
+
+# Slotted dataclasses need Python 3.10+; older interpreters keep the __dict__ layout
+_DATACLASS_OPTIONS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class AppConfig:
     """Application configuration data structure."""
 
@@ -23,6 +64,20 @@ class AppConfig:
     window_state: Dict[str, Any] = field(default_factory=dict)
 
 
+_APPCONFIG_FIELD_NAMES = tuple(f.name for f in fields(AppConfig))
+_APPCONFIG_FIELDS = frozenset(_APPCONFIG_FIELD_NAMES)
+
+# Field getters keyed by name, replacing hasattr/getattr reflection in get()/set()
+_FIELD_GETTERS: Dict[str, Callable[[AppConfig], Any]] = {
+    name: attrgetter(name) for name in _APPCONFIG_FIELD_NAMES
+}
+
+
+def _config_to_dict(config: AppConfig) -> Dict[str, Any]:
+    """Shallow field-to-value mapping that works for slotted and regular dataclasses."""
+    return {name: getattr(config, name) for name in _APPCONFIG_FIELD_NAMES}
+
+
 class ConfigManager:
     """Manages application configuration and settings."""
 
@@ -32,6 +87,11 @@ class ConfigManager:
             self.config_path = self._validate_config_path(config_path)
             self.config = AppConfig()
             self.logger = logging.getLogger(__name__)
+            self._saved_snapshot: Optional[bytes] = None
+            self._save_pending = False
+            self._save_timer: Optional[QTimer] = None
+            self._fallback_timer: Optional[threading.Timer] = None
+            self._lock = threading.RLock()
         except Exception as e:
             logger.error(f"Failed to initialize config manager: {e}")
             raise
@@ -46,8 +106,10 @@ class ConfigManager:
             Validated Path object
         """
         try:
-            path = config_path or Path.home() / ".jellyfin_music_organizer" / "config.json"
-            path.parent.mkdir(parents=True, exist_ok=True)
+            path = config_path or _default_config_path()
+            if path.parent not in _ENSURED_DIRS:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                _ENSURED_DIRS.add(path.parent)
             return path
         except Exception as e:
             logger.error(f"Failed to validate config path: {e}")
@@ -57,42 +119,103 @@ class ConfigManager:
         """Load configuration from file if it exists."""
         if self.config_path.exists():
             try:
-                with open(self.config_path, "r") as f:
-                    data = json.load(f)
-                    self.config = AppConfig(**data)
-            except (json.JSONDecodeError, KeyError) as e:
-                print(f"Error loading config: {e}")
+                with open(self.config_path, "rb") as f:
+                    data = json_compat.loads(f.read())
+            except json_compat.JSONDecodeError as e:
+                logger.warning("Error loading config: %s", e)
+                return
 
-    def save(self) -> None:
-        """Save current configuration to file with backup."""
-        backup_path = self.config_path.with_suffix(".json.bak")
-        try:
-            # Create backup of existing config
-            if self.config_path.exists():
-                self.config_path.rename(backup_path)
+            if not isinstance(data, dict):
+                logger.warning("Error loading config: expected a JSON object")
+                return
 
-            # Save new config
-            with open(self.config_path, "w", encoding="utf-8") as f:
-                json.dump(self.config.__dict__, f, indent=4, ensure_ascii=False)
+            # Unknown keys (e.g. from newer versions) are dropped instead of raising TypeError
+            self.config = AppConfig(**{k: v for k, v in data.items() if k in _APPCONFIG_FIELDS})
 
-            # Remove backup on successful save
-            if backup_path.exists():
-                backup_path.unlink()
+    def save(self) -> None:
+        """Save current configuration to file atomically.
 
-            logger.debug("Configuration saved successfully")
-        except Exception as e:
-            logger.error(f"Failed to save configuration: {e}")
-            # Restore backup if save failed
-            if backup_path.exists():
-                backup_path.rename(self.config_path)
-            raise
+        The write is skipped when nothing changed since the last successful save.
+        """
+        with self._lock:
+            self._save_pending = False
+            _PENDING_SAVES.discard(self)
+            # Compact output unless debugging, when a readable file is worth the extra bytes
+            payload = json_compat.dumps(
+                _config_to_dict(self.config), pretty=logger.isEnabledFor(logging.DEBUG)
+            )
+            if payload == self._saved_snapshot and self.config_path.exists():
+                return
+
+            tmp_name: Optional[str] = None
+            try:
+                # Write to a sibling temp file, then atomically swap it into place
+                with tempfile.NamedTemporaryFile(
+                    mode="wb", dir=self.config_path.parent, suffix=".tmp", delete=False
+                ) as tmp:
+                    tmp_name = tmp.name
+                    tmp.write(payload)
+                    tmp.flush()
+                    os.fsync(tmp.fileno())
+                os.replace(tmp_name, self.config_path)
+
+                self._saved_snapshot = payload
+                logger.debug("Configuration saved successfully")
+            except Exception as e:
+                logger.error("Failed to save configuration: %s", e)
+                if tmp_name is not None and os.path.exists(tmp_name):
+                    os.unlink(tmp_name)
+                raise
+
+    def flush(self) -> None:
+        """Write any pending configuration change to disk immediately."""
+        if self._save_pending:
+            self.save()
+
+    def _flush(self) -> None:
+        """Timer and exit callback for deferred saves; errors are logged by save()."""
+        try:
+            self.flush()
+        except Exception:
+            pass
+
+    def _schedule_save(self) -> None:
+        """Coalesce rapid configuration changes into a single deferred save."""
+        self._save_pending = True
+        _PENDING_SAVES.add(self)
+        app = QCoreApplication.instance()
+        if app is not None and QThread.currentThread() == app.thread():
+            if self._save_timer is None:
+                self._save_timer = QTimer()
+                self._save_timer.setSingleShot(True)
+                self._save_timer.setInterval(SAVE_DEBOUNCE_MS)
+                self._save_timer.timeout.connect(self._flush)
+            self._save_timer.start()
+            return
+
+        # No Qt event loop available on this thread
+        with self._lock:
+            if self._fallback_timer is not None:
+                self._fallback_timer.cancel()
+            self._fallback_timer = threading.Timer(SAVE_DEBOUNCE_MS / 1000, self._flush)
+            self._fallback_timer.daemon = True
+            self._fallback_timer.start()
 
     def get(self, key: str) -> Any:
         """Get a configuration value."""
-        return getattr(self.config, key, None)
+        getter = _FIELD_GETTERS.get(key)
+        return getter(self.config) if getter is not None else None
 
     def set(self, key: str, value: Any) -> None:
-        """Set a configuration value."""
-        if hasattr(self.config, key):
-            setattr(self.config, key, value)
-            self.save()
+        """Set a configuration value.
+
+        The change is written to disk after a short delay; call flush() to persist it now.
+        """
+        getter = _FIELD_GETTERS.get(key)
+        if getter is None:
+            return
+        # A dict or list edited in place and passed back compares equal to itself
+        if isinstance(value, _IMMUTABLE_TYPES) and getter(self.config) == value:
+            return
+        setattr(self.config, key, value)
+        self._schedule_save()
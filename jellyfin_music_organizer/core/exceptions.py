@@ -4,6 +4,8 @@ from typing import Optional
 class JellyfinMusicOrganizerError(Exception):
     """Base exception for all application errors."""
 
+    __slots__ = ("cause",)
+
     def __init__(self, message: str, cause: Optional[Exception] = None) -> None:
         super().__init__(message)
         self.cause = cause
@@ -12,26 +14,40 @@ class JellyfinMusicOrganizerError(Exception):
 class FileOperationError(JellyfinMusicOrganizerError):
     """Raised when file operations fail."""
 
+    __slots__ = ()
+
 
 class MetadataError(JellyfinMusicOrganizerError):
     """Raised when metadata operations fail."""
 
+    __slots__ = ()
+
 
 class ConfigurationError(JellyfinMusicOrganizerError):
     """Raised when configuration operations fail."""
 
+    __slots__ = ()
+
 
 class ResourceError(JellyfinMusicOrganizerError):
     """Raised when resource operations fail."""
 
+    __slots__ = ()
+
 
 class UIError(JellyfinMusicOrganizerError):
     """Base class for UI-related errors."""
 
+    __slots__ = ()
+
 
 class WindowError(UIError):
     """Raised when window operations fail."""
 
+    __slots__ = ()
+
 
 class DialogError(UIError):
     """Raised when dialog operations fail."""
+
+    __slots__ = ()
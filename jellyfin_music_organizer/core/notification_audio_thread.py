@@ -1,29 +1,66 @@
 """
-Thread for playing notification sounds.
+Player for notification sounds.
 """
 
 import os
 import sys
+from pathlib import Path
+from typing import Dict, Optional
 
-from PyQt5.QtCore import QThread, QUrl, pyqtSignal
-from PyQt5.QtMultimedia import QMediaContent, QMediaPlayer
+from PyQt5.QtCore import QObject, QUrl, pyqtSignal
+from PyQt5.QtMultimedia import QSoundEffect
 
+# Resolved once at import; PyInstaller bundles unpack under sys._MEIPASS
+_AUDIO_DIR: Path = (
+    Path(getattr(sys, "_MEIPASS", os.path.dirname(os.path.abspath(__file__))))
+    / "notification_audio"
+)
 
-class NotificationAudioThread(QThread):
+# Preloaded sound effects keyed by audio file name, shared by every player instance
+_sound_effects: Dict[str, QSoundEffect] = {}
+
+
+def _get_sound_effect(audio_file_name: str) -> QSoundEffect:
+    """
+    Get the cached sound effect for an audio file, loading it on first use.
+
+    Args:
+        audio_file_name: Name of the audio file (without extension)
+
+    Returns:
+        QSoundEffect: Preloaded effect ready to play
+    """
+    effect = _sound_effects.get(audio_file_name)
+    if effect is None:
+        audio_path = _AUDIO_DIR / f"{audio_file_name}.wav"
+
+        effect = QSoundEffect()
+        effect.setSource(QUrl.fromLocalFile(str(audio_path)))
+        effect.setLoopCount(1)
+        _sound_effects[audio_file_name] = effect
+    return effect
+
+
+class NotificationAudioThread(QObject):
     """
-    A QThread subclass that handles playing notification sounds.
+    Plays notification sounds on the GUI thread's event loop.
+
+    QSoundEffect plays asynchronously, so no worker thread is needed. The name
+    is kept from the QThread-based player for existing callers.
 
-    This thread:
-    1. Loads the specified audio file
+    This player:
+    1. Looks up the preloaded sound effect
     2. Plays the notification sound
-    3. Handles cleanup when finished
+    3. Signals completion when the effect stops playing
 
     Signals:
-        kill_thread_signal (str): Emitted to signal thread termination
+        kill_thread_signal (str): Emitted once the cue has finished
     """
 
     kill_thread_signal: pyqtSignal = pyqtSignal(str)
 
+    _instance: Optional["NotificationAudioThread"] = None
+
     def __init__(self, audio_file_name: str) -> None:
         """
         Initialize the NotificationAudioThread.
@@ -33,33 +70,47 @@ class NotificationAudioThread(QThread):
         """
         super().__init__()
         self.audio_file_name = audio_file_name
-        self.media_player: QMediaPlayer = QMediaPlayer()
-        self.media_player.mediaStatusChanged.connect(self.on_media_status_changed)
+        # Created on the constructing (GUI) thread so the effect keeps its event loop
+        self.sound_effect: QSoundEffect = _get_sound_effect(audio_file_name)
+        self.sound_effect.playingChanged.connect(self._on_playing_changed)
 
-    def run(self) -> None:
+    @classmethod
+    def instance(cls, audio_file_name: str) -> "NotificationAudioThread":
         """
-        Main thread execution method.
+        Get the shared notification player, creating it on first use.
+
+        Args:
+            audio_file_name: Cue to load if the player has to be created
 
-        This method:
-        1. Constructs the path to the audio file
-        2. Sets up the media player
-        3. Plays the notification sound
+        Returns:
+            NotificationAudioThread: Player reused for every notification
         """
-        base_path: str = getattr(sys, "_MEIPASS", os.path.dirname(os.path.abspath(__file__)))
-        audio_path: str = os.path.join(base_path, f"notification_audio/{self.audio_file_name}.wav")
+        if cls._instance is None:
+            cls._instance = cls(audio_file_name)
+        return cls._instance
 
-        # Set media content and play the audio using QMediaPlayer
-        self.media_player.setMedia(QMediaContent(QUrl.fromLocalFile(audio_path)))
-        self.media_player.play()
+    def start(self) -> None:
+        """Play the cue given at construction."""
+        self.sound_effect.play()
 
-    def on_media_status_changed(self, status: QMediaPlayer.MediaStatus) -> None:
+    def play(self, audio_file_name: str) -> None:
         """
-        Handle media status changes.
+        Play a notification cue, replacing the one that is playing.
 
         Args:
-            status: Current status of the media player
+            audio_file_name: Name of the audio file to play (without extension)
         """
-        if status == QMediaPlayer.MediaStatus.EndOfMedia:
-            self.media_player.stop()
-            self.media_player.deleteLater()
+        effect = _get_sound_effect(audio_file_name)
+        if effect is not self.sound_effect:
+            # Only the latest cue reports completion
+            self.sound_effect.playingChanged.disconnect(self._on_playing_changed)
+            self.sound_effect.stop()
+            effect.playingChanged.connect(self._on_playing_changed)
+            self.sound_effect = effect
+        self.audio_file_name = audio_file_name
+        self.sound_effect.play()
+
+    def _on_playing_changed(self) -> None:
+        """Signal completion once the current cue stops playing."""
+        if not self.sound_effect.isPlaying():
             self.kill_thread_signal.emit("notification")
@@ -2,21 +2,134 @@
 Thread for organizing music files based on their metadata.
 """
 
-import json
 import logging
 import os
+import queue
+import re
+import sys
+import tempfile
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, List
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Set, Tuple
 
-from mutagen.asf import ASFUnicodeAttribute
-from PyQt5.QtCore import QThread, pyqtSignal
+from PyQt5.QtCore import QRunnable, QThread, QThreadPool, pyqtSignal
 
+from ..utils.config import get_settings
+from ..utils.constants import AudioFormats
 from ..utils.exceptions import MetadataError
-from ..utils.file_ops import FileOperations
 from .exceptions import FileOperationError
 
 logger = logging.getLogger(__name__)
 
+# Supported audio file extensions, lowercase with leading dot
+_AUDIO_EXTENSIONS = frozenset(AudioFormats.EXTENSIONS)
+
+# Lowercase tag keys that hold the artist and album names
+_ARTIST_KEYS = frozenset(("©art", "artist", "author", "tpe1"))
+_ALBUM_KEYS = frozenset(("©alb", "album", "talb"))
+
+# Error recorded for files left for the replace/skip window
+_EXISTING_FILE_ERROR = "File already exists in the destination folder"
+
+# Result for files that need no follow-up; read-only so the shared instance can't be modified
+_NO_FILE_INFO: Mapping[str, Any] = MappingProxyType({})
+
+# Tag parsing is dominated by file reads, so oversubscribe the CPU count
+_METADATA_WORKERS = (os.cpu_count() or 1) * 2
+
+# Top-level folders of the library walked concurrently
+_SCAN_WORKERS = os.cpu_count() or 1
+
+# Discovered paths buffered ahead of the organize loop
+_SCAN_QUEUE_SIZE = 1024
+
+# Files whose metadata may be extracted ahead of being organized
+_MAX_IN_FLIGHT = _METADATA_WORKERS * 4
+
+# Songs found between updates of the running song count
+_SCAN_REPORT_INTERVAL = 256
+
+# Pending copies allowed before tag processing waits for the writer thread
+_COPY_QUEUE_SIZE = 64
+
+# Queued copy: source, metadata, file name, artist data, album data
+_CopyJob = Tuple[Path, Dict[str, str], str, Any, Any]
+
+
+def _scandir_recursive(root: str) -> Iterator[Path]:
+    """Yield every supported audio file below a directory in a single tree walk.
+
+    Args:
+        root: Directory to scan
+
+    Yields:
+        Path: Path of each audio file found
+    """
+    try:
+        with os.scandir(root) as it:
+            for entry in it:
+                # DirEntry reuses the type information returned by the directory read
+                if entry.is_dir(follow_symlinks=False):
+                    yield from _scandir_recursive(entry.path)
+                elif (
+                    entry.is_file() and os.path.splitext(entry.name)[1].lower() in _AUDIO_EXTENSIONS
+                ):
+                    yield Path(entry.path)
+    except OSError as e:
+        # Unreadable or vanished directories are skipped; the rest of the tree is still walked
+        logger.warning(f"Skipping unreadable directory: {e}")
+
+
+def _is_case_insensitive(directory: Path) -> bool:
+    """Check whether a directory's filesystem treats differently cased names as one file.
+
+    Args:
+        directory: Existing directory to probe
+
+    Returns:
+        bool: True if a file is found again under its upper-cased name
+    """
+    try:
+        with tempfile.NamedTemporaryFile(prefix=".jmo_case_", dir=directory) as probe:
+            return os.path.exists(os.path.join(directory, os.path.basename(probe.name).upper()))
+    except OSError:
+        # Not writable or not created yet; assume the platform's default filesystem
+        return sys.platform.startswith("win") or sys.platform == "darwin"
+
+
+class _SubtreeScanTask(QRunnable):
+    """Walk one top-level folder of the music library on a pool thread."""
+
+    def __init__(
+        self,
+        root: str,
+        scan_queue: "queue.Queue[Optional[Path]]",
+        on_error: Callable[[Exception], None],
+    ) -> None:
+        """
+        Initialize the scan task.
+
+        Args:
+            root: Folder to walk
+            scan_queue: Queue receiving each music file found
+            on_error: Called with any exception that stops the walk
+        """
+        super().__init__()
+        self.root = root
+        self.scan_queue = scan_queue
+        self.on_error = on_error
+
+    def run(self) -> None:
+        """Queue every music file below the folder."""
+        try:
+            for path in _scandir_recursive(self.root):
+                self.scan_queue.put(path)
+        except Exception as e:
+            self.on_error(e)
+
 
 class OrganizeThread(QThread):
     """
@@ -42,6 +155,10 @@ class OrganizeThread(QThread):
     custom_dialog_signal: pyqtSignal = pyqtSignal(str)
     organize_finish_signal: pyqtSignal = pyqtSignal(dict)
 
+    # Characters that are not allowed in filenames, removed in a single translate pass
+    _ILLEGAL_TRANS = str.maketrans("", "", ":*?<>|/\\\"'")
+    _ELLIPSIS_RE = re.compile(r"\.{3,}")
+
     def __init__(self, info: Dict[str, str]) -> None:
         """
         Initialize the OrganizeThread.
@@ -52,6 +169,15 @@ class OrganizeThread(QThread):
         super().__init__()
         self.info = info
         self.remove_illegal_chars = True  # Default to True
+        self._copy_queue: "queue.Queue[Optional[_CopyJob]]" = queue.Queue(maxsize=_COPY_QUEUE_SIZE)
+        # Normalized file names per destination directory, including files queued for copying
+        self._dest_listing_cache: Dict[Path, Set[str]] = {}
+        # Maps a file name to its listing key; run() picks case folding for the destination
+        self._fold_name: Callable[[str], str] = os.path.normcase
+        # Destination directories already created by the writer thread
+        self._created_dirs: Set[Path] = set()
+        self._recall_lock = threading.Lock()
+        self._scan_error: Optional[Exception] = None
         self.load_settings()
 
     def __del__(self) -> None:
@@ -60,12 +186,7 @@ class OrganizeThread(QThread):
 
     def load_settings(self) -> None:
         """Load settings from the settings file."""
-        try:
-            with open("settings_jmo.json", "r") as f:
-                settings = json.load(f)
-                self.remove_illegal_chars = settings.get("remove_illegal_chars", True)
-        except FileNotFoundError:
-            pass  # Use default value
+        self.remove_illegal_chars = get_settings().get("remove_illegal_chars", True)
 
     def clean_filename(self, text: str) -> str:
         """
@@ -79,14 +200,7 @@ class OrganizeThread(QThread):
         """
         if self.remove_illegal_chars:
             # Remove characters that are not allowed in filenames
-            text = (
-                text.translate(str.maketrans("", "", ":*?<>|"))
-                .replace("/", "")
-                .replace("\\", "")
-                .replace('"', "")
-                .replace("'", "")
-                .replace("...", "")
-            )
+            text = self._ELLIPSIS_RE.sub("", text.translate(self._ILLEGAL_TRANS))
         return text.strip()
 
     def run(self) -> None:
@@ -100,130 +214,88 @@ class OrganizeThread(QThread):
         4. Handles file copying and errors
         """
         try:
-            # Supported audio file extensions
-            extensions: List[str] = [
-                ".aif",
-                ".aiff",
-                ".ape",
-                ".flac",
-                ".m4a",
-                ".m4b",
-                ".m4r",
-                ".mp2",
-                ".mp3",
-                ".mp4",
-                ".mpc",
-                ".ogg",
-                ".opus",
-                ".wav",
-                ".wma",
-            ]
-
-            # Generate list of paths to music files
-            pathlist: List[Path] = []
-            for extension in extensions:
-                pathlist.extend(
-                    list(Path(self.info["selected_music_folder_path"]).glob(f"**/*{extension}"))
-                )
-
-            # Update number of songs label
-            total_number_of_songs: int = len(pathlist)
-            self.number_songs_signal.emit(total_number_of_songs)
-
-            # Define the artist and album values to search for
-            artist_values: List[str] = ["©art", "artist", "author", "tpe1"]
-            album_values: List[str] = ["©alb", "album", "talb"]
-
-            # Check if folder has any songs
-            if total_number_of_songs:
-                # Initialize a dictionary to store file info for songs with errors
-                recall_files: Dict[str, List[Dict[str, Any]]] = {
-                    "error_files": [],
-                    "replace_skip_files": [],
-                }
-
-                # Don't include replace_skip_files in progress bar
-                i: int = 0
-
-                # Loop through each song and organize it
-                for path in pathlist:
-                    # Replace backslashes with forward slashes
-                    path_in_str: str = str(path).replace("\\", "/")
-                    # Get file name from path
-                    file_name: str = path_in_str.split("/")[-1]
-
-                    # Reset variables
-                    artist_data: Any = ""
-                    album_data: Any = ""
-                    file_info: Dict[str, Any] = {}
-
-                    try:
-                        # Load and extract metadata from the music file
-                        metadata: Dict[str, str] = self.process_metadata(path)
-                        if metadata is None:
-                            raise ValueError(f"Could not load metadata from {path_in_str}")
-
-                        # Loop through the metadata to find matching artist and album values
-                        for key, value in metadata.items():
-                            lowercase_key: str = key.lower()
-                            if lowercase_key in artist_values:
-                                artist_data = value
-                            elif lowercase_key in album_values:
-                                album_data = value
-
-                        # Check if artist_data and album_data were found
-                        if artist_data == "" or album_data == "":
-                            raise Exception("Artist or album data not found")
-
-                        # Convert the metadata values to strings
-                        artist: str = (
-                            str(artist_data[0])
-                            if isinstance(artist_data[0], ASFUnicodeAttribute)
-                            else artist_data[0]
-                        )
-                        album: str = (
-                            str(album_data[0])
-                            if isinstance(album_data[0], ASFUnicodeAttribute)
-                            else album_data[0]
-                        )
-
-                        # Clean the artist and album names
-                        artist = self.clean_filename(artist)
-                        album = self.clean_filename(album)
-
-                        # Construct new location
-                        new_location: str = (
-                            f"{self.info['selected_destination_folder_path']}/{artist}/{album}"
-                        )
-
-                        # Check if the file already exists in the new location
-                        if Path(f"{new_location}/{file_name}").exists():
-                            file_info = self._handle_existing_file(
-                                file_name, new_location, path_in_str
-                            )
-
-                            recall_files["replace_skip_files"].append(file_info)
-                        else:
-                            # Create directory and copy file to new location
-                            self.organize_file(path, metadata)
-
-                    except Exception as e:
-                        file_info = self._create_error_info(
-                            file_name, artist_data, album_data, metadata, str(e)
+            destination_root = Path(self.info["selected_destination_folder_path"])
+            # normcase only folds case on Windows; macOS volumes are usually case-insensitive too
+            fold: Callable[[str], str] = (
+                str.casefold if _is_case_insensitive(destination_root) else os.path.normcase
+            )
+            self._fold_name = fold
+
+            # Initialize a dictionary to store file info for songs with errors
+            recall_files: Dict[str, List[Dict[str, Any]]] = {
+                "error_files": [],
+                "replace_skip_files": [],
+            }
+
+            # Walk the tree on its own thread so files are organized while the scan continues
+            scan_queue: "queue.Queue[Optional[Path]]" = queue.Queue(maxsize=_SCAN_QUEUE_SIZE)
+            scanner = threading.Thread(
+                target=self._scan_worker,
+                args=(self.info["selected_music_folder_path"], scan_queue),
+                daemon=True,
+            )
+            scanner.start()
+
+            # Running count of songs found; final once the scan has finished
+            total_number_of_songs: int = 0
+            scan_finished: bool = False
+
+            # Don't include replace_skip_files in progress bar
+            i: int = 0
+            # Last percentage sent; only changes are emitted to the GUI thread
+            last_progress: int = -1
+
+            pending: Dict[Future, Path] = {}
+            with ThreadPoolExecutor(max_workers=_METADATA_WORKERS) as executor, self._copy_writer(
+                recall_files["error_files"]
+            ):
+                while not scan_finished or pending:
+                    # Read tags on worker threads, keeping a bounded number of files in flight
+                    while not scan_finished and len(pending) < _MAX_IN_FLIGHT:
+                        try:
+                            # Only wait on the scanner when no finished files are left to report
+                            path = scan_queue.get(block=not pending)
+                        except queue.Empty:
+                            break
+                        if path is None:
+                            scan_finished = True
+                            if self._scan_error is not None:
+                                raise self._scan_error
+                            # Update number of songs label
+                            self.number_songs_signal.emit(total_number_of_songs)
+                            break
+                        total_number_of_songs += 1
+                        if total_number_of_songs % _SCAN_REPORT_INTERVAL == 0:
+                            self.number_songs_signal.emit(total_number_of_songs)
+                        pending[executor.submit(self.process_metadata, path)] = path
+
+                    if not pending:
+                        continue
+
+                    # Organize each song as its metadata becomes available
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        file_info = self._organize_result(
+                            pending.pop(future), future, recall_files, destination_root
                         )
 
-                        recall_files["error_files"].append(file_info)
-
-                    finally:
                         # Update progress bar if no error or 'File already exists'
-                        if (
-                            not file_info.get("error")
-                            or file_info.get("error")
-                            != "File already exists in the destination folder"
-                        ):
+                        if file_info.get("error") != _EXISTING_FILE_ERROR:
                             i += 1
-                            self.music_progress_signal.emit(int(i / len(pathlist) * 100))
 
+                    # Percentages need the final total, so progress starts once the scan is done
+                    if scan_finished:
+                        progress = i * 100 // total_number_of_songs
+                        if progress != last_progress:
+                            self.music_progress_signal.emit(progress)
+                            last_progress = progress
+
+            # Check if folder has any songs
+            if total_number_of_songs:
+                # Files finished before the scan did were never reported; send the final value
+                progress = i * 100 // total_number_of_songs
+                if progress != last_progress:
+                    self.music_progress_signal.emit(progress)
                 # Send recall_files
                 self.organize_finish_signal.emit(recall_files)
 
@@ -236,6 +308,214 @@ class OrganizeThread(QThread):
             self.custom_dialog_signal.emit(f"Organization failed: {str(e)}")
             self.kill_thread_signal.emit("organize")
 
+    def _scan_worker(self, root: str, scan_queue: "queue.Queue[Optional[Path]]") -> None:
+        """Feed discovered music files to the organize loop.
+
+        Args:
+            root: Directory to scan
+            scan_queue: Queue receiving each path, followed by None when the scan ends
+        """
+        self._scan_error = None
+        pool = QThreadPool()
+        pool.setMaxThreadCount(_SCAN_WORKERS)
+        try:
+            with os.scandir(root) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        # Each top-level folder, usually an artist, is walked concurrently
+                        pool.start(_SubtreeScanTask(entry.path, scan_queue, self._set_scan_error))
+                    elif (
+                        entry.is_file()
+                        and os.path.splitext(entry.name)[1].lower() in _AUDIO_EXTENSIONS
+                    ):
+                        scan_queue.put(Path(entry.path))
+        except OSError as e:
+            # A missing or unreadable source folder has no songs, as with the former glob
+            logger.warning(f"Skipping unreadable directory: {e}")
+        except Exception as e:
+            self._set_scan_error(e)
+        finally:
+            pool.waitForDone()
+            scan_queue.put(None)
+
+    def _set_scan_error(self, error: Exception) -> None:
+        """Keep the first error raised while scanning.
+
+        Args:
+            error: Exception raised by a scan
+        """
+        if self._scan_error is None:
+            self._scan_error = error
+
+    def _organize_result(
+        self,
+        path: Path,
+        future: "Future[Dict[str, str]]",
+        recall_files: Dict[str, List[Dict[str, Any]]],
+        destination_root: Path,
+    ) -> Mapping[str, Any]:
+        """Match a song's extracted metadata to its destination and queue the copy.
+
+        Args:
+            path: Source path of the song
+            future: Completed metadata extraction for the song
+            recall_files: Results collected for the replace/skip and error windows
+            destination_root: Root folder that artist/album directories are created in
+
+        Returns:
+            Mapping[str, Any]: Replace/skip or error information, empty if the copy was queued
+        """
+        file_name: str = path.name
+
+        # Reset variables
+        artist_data: Any = ""
+        album_data: Any = ""
+        metadata: Optional[Dict[str, str]] = None
+
+        try:
+            # Collect the metadata extracted by the worker
+            metadata = future.result()
+            if metadata is None:
+                raise ValueError(f"Could not load metadata from {path.as_posix()}")
+
+            # Loop through the metadata to find matching artist and album values
+            for key, value in metadata.items():
+                lowercase_key: str = key.lower()
+                if lowercase_key in _ARTIST_KEYS:
+                    artist_data = value
+                elif lowercase_key in _ALBUM_KEYS:
+                    album_data = value
+                if artist_data and album_data:
+                    break
+
+            # Check if artist_data and album_data were found
+            if artist_data == "" or album_data == "":
+                raise Exception("Artist or album data not found")
+
+            # Convert the metadata values to strings; str() also handles ASF attributes
+            artist: str = str(artist_data[0])
+            album: str = str(album_data[0])
+
+            # Clean the artist and album names
+            artist = self.clean_filename(artist)
+            album = self.clean_filename(album)
+
+            # Construct new location
+            dest_dir = destination_root / artist / album
+            dest_names = self._dest_names(dest_dir)
+            dest_key = self._fold_name(file_name)
+
+            # Check if the file already exists or is already queued for copying
+            if dest_key in dest_names:
+                if self._is_same_file(path, dest_dir / file_name):
+                    # Already copied by an earlier run; nothing for the user to decide
+                    logger.debug(f"Skipping unchanged file: {path.as_posix()}")
+                    return _NO_FILE_INFO
+
+                file_info = self._handle_existing_file(
+                    file_name, dest_dir.as_posix(), path.as_posix()
+                )
+
+                recall_files["replace_skip_files"].append(file_info)
+                return file_info
+            else:
+                # Hand the copy to the writer thread and move on to the next file
+                dest_names.add(dest_key)
+                self._copy_queue.put((path, metadata, file_name, artist_data, album_data))
+
+        except Exception as e:
+            error_info = self._create_error_info(
+                file_name, artist_data, album_data, metadata or {}, str(e)
+            )
+
+            with self._recall_lock:
+                recall_files["error_files"].append(error_info)
+            return error_info
+
+        # Only replace/skip and error entries are kept, so queued copies share one empty mapping
+        return _NO_FILE_INFO
+
+    @contextmanager
+    def _copy_writer(self, error_files: List[Dict[str, Any]]) -> Iterator[None]:
+        """Run a writer thread that copies queued files until the block exits.
+
+        Args:
+            error_files: List that receives error information for failed copies
+        """
+        writer = threading.Thread(target=self._copy_worker, args=(error_files,), daemon=True)
+        writer.start()
+        try:
+            yield
+        finally:
+            # Sentinel stops the writer once every queued copy has been drained
+            self._copy_queue.put(None)
+            writer.join()
+            self._dest_listing_cache.clear()
+            self._created_dirs.clear()
+
+    def _dest_names(self, dest_dir: Path) -> Set[str]:
+        """Get the file names in a destination directory, listing it on first use.
+
+        Args:
+            dest_dir: Destination artist/album directory
+
+        Returns:
+            Set[str]: Names of the files in the directory, folded by _fold_name
+        """
+        names = self._dest_listing_cache.get(dest_dir)
+        if names is None:
+            try:
+                with os.scandir(dest_dir) as it:
+                    names = {self._fold_name(entry.name) for entry in it}
+            except (FileNotFoundError, NotADirectoryError):
+                names = set()
+            self._dest_listing_cache[dest_dir] = names
+        return names
+
+    def _copy_worker(self, error_files: List[Dict[str, Any]]) -> None:
+        """Copy queued files so disk writes overlap with metadata processing.
+
+        Args:
+            error_files: List that receives error information for failed copies
+        """
+        while True:
+            job = self._copy_queue.get()
+            if job is None:
+                break
+            path, metadata, file_name, artist_data, album_data = job
+            try:
+                # Create directory and copy file to new location
+                self.organize_file(path, metadata)
+            except Exception as e:
+                file_info = self._create_error_info(
+                    file_name, artist_data, album_data, metadata, str(e)
+                )
+                with self._recall_lock:
+                    error_files.append(file_info)
+
+    @staticmethod
+    def _is_same_file(source: Path, dest: Path) -> bool:
+        """Check whether a destination file is an unchanged copy of the source.
+
+        Copies keep the source modification time, so matching size and whole-second
+        mtime means the file was organized before and hasn't changed since.
+
+        Args:
+            source: Source file path
+            dest: Existing destination file path
+
+        Returns:
+            bool: True if size and modification time match
+        """
+        try:
+            src_stat = source.stat()
+            dest_stat = dest.stat()
+        except OSError:
+            # Destination is only queued for copying, or unreadable
+            return False
+        same_size = src_stat.st_size == dest_stat.st_size
+        return same_size and int(src_stat.st_mtime) == int(dest_stat.st_mtime)
+
     def _handle_existing_file(
         self, file_name: str, new_location: str, path_in_str: str
     ) -> Dict[str, str]:
@@ -253,7 +533,7 @@ class OrganizeThread(QThread):
             "file_name": file_name,
             "new_location": new_location,
             "path_in_str": path_in_str,
-            "error": "File already exists in the destination folder",
+            "error": _EXISTING_FILE_ERROR,
         }
 
     def _create_destination_path(self, metadata: Dict[str, str]) -> Path:
@@ -282,15 +562,19 @@ class OrganizeThread(QThread):
 
     def organize_file(self, source: Path, metadata: Dict[str, str]) -> None:
         """Organize a single file based on its metadata."""
+        from ..utils.file_ops import FileOperations
+
         try:
             # Create destination path from metadata
             dest = self._create_destination_path(metadata)
 
-            # Ensure destination directory exists
-            dest.parent.mkdir(parents=True, exist_ok=True)
+            # Ensure destination directory exists, once per directory
+            if dest.parent not in self._created_dirs:
+                dest.parent.mkdir(parents=True, exist_ok=True)
+                self._created_dirs.add(dest.parent)
 
             # Copy file with metadata preservation
-            FileOperations.safe_copy(source, dest, preserve_metadata=True)
+            FileOperations.safe_copy(source, dest, preserve_metadata=True, create_parent=False)
         except Exception as e:
             logger.error(f"Failed to organize file: {e}")
             raise FileOperationError(f"Failed to organize file: {e}")
@@ -361,12 +645,7 @@ class OrganizeThread(QThread):
             # Convert metadata to Dict[str, str]
             processed_metadata: Dict[str, str] = {}
             for key, value in metadata.items():
-                if isinstance(value, (str, list)):
-                    processed_metadata[key] = str(value[0] if isinstance(value, list) else value)
-                elif isinstance(value, ASFUnicodeAttribute):
-                    processed_metadata[key] = str(value)
-                else:
-                    processed_metadata[key] = str(value)
+                processed_metadata[key] = str(value[0] if isinstance(value, list) else value)
 
             return processed_metadata
 
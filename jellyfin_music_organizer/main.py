@@ -9,7 +9,6 @@ from typing import Optional
 
 from PyQt5.QtWidgets import QApplication, QMessageBox
 
-from .ui.music_organizer import MusicOrganizer
 from .utils.config import ConfigManager
 from .utils.logger import setup_logger
 from .utils.platform_utils import PlatformPaths, platform
@@ -38,6 +37,9 @@ def main() -> None:
         if platform.system() == "Windows":
             QtCompat.set_high_dpi_scaling(app)
 
+        # Imported once the application exists; pulls in every window and the organizer
+        from .ui.music_organizer import MusicOrganizer
+
         window = MusicOrganizer()
         window.show()
 
@@ -2,11 +2,24 @@
 UI components for the Jellyfin Music Organizer.
 """
 
-from .custom_dialog import CustomDialog
-from .music_error_window import MusicErrorWindow
-from .music_organizer import MusicOrganizer
-from .replace_skip_window import ReplaceSkipWindow
-from .settings_window import SettingsWindow
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .custom_dialog import CustomDialog
+    from .music_error_window import MusicErrorWindow
+    from .music_organizer import MusicOrganizer
+    from .replace_skip_window import ReplaceSkipWindow
+    from .settings_window import SettingsWindow
+
+# Windows are imported on first access so importing the package doesn't load every window
+_LAZY_IMPORTS = {
+    "CustomDialog": ".custom_dialog",
+    "MusicErrorWindow": ".music_error_window",
+    "MusicOrganizer": ".music_organizer",
+    "ReplaceSkipWindow": ".replace_skip_window",
+    "SettingsWindow": ".settings_window",
+}
 
 __all__ = [
     "MusicOrganizer",
@@ -15,3 +28,13 @@ __all__ = [
     "MusicErrorWindow",
     "CustomDialog",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a window class the first time it is accessed."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
@@ -2,24 +2,102 @@
 Custom dialog window for displaying messages to the user.
 """
 
-import json
-import platform
+import sys
+from dataclasses import dataclass
+from functools import lru_cache
 from logging import getLogger
-from pathlib import Path
-from typing import Any, Dict, Optional
+from operator import methodcaller
+from typing import Any, Optional
 
 from PyQt5.QtCore import QPoint, Qt
-from PyQt5.QtGui import QIcon, QMouseEvent
-from PyQt5.QtWidgets import QDialog, QHBoxLayout, QLabel, QPushButton, QVBoxLayout, QWidget
-
-from ..utils.config_manager import ConfigManager
+from PyQt5.QtGui import QIcon, QMouseEvent, QPixmap
+from PyQt5.QtWidgets import (
+    QBoxLayout,
+    QDialog,
+    QHBoxLayout,
+    QLabel,
+    QPushButton,
+    QVBoxLayout,
+    QWidget,
+)
+
+from ..utils.config import ConfigManager
 from ..utils.notifications import NotificationManager
 from ..utils.platform_utils import PlatformUI
-from ..utils.qt_types import QtConstants, WindowFlags
+from ..utils.qt_types import QtConstants, WidgetAttribute, WindowFlags
 from ..utils.resource_manager import ResourceManager
 
 logger = getLogger(__name__)
 
+# sys.platform is fixed at build time, unlike platform.system() which may spawn a subprocess
+_IS_WIN = sys.platform.startswith("win")
+_IS_MAC = sys.platform == "darwin"
+
+# Cleanup handler for registered Qt resources; a C-level callable instead of a lambda
+_DELETE_LATER = methodcaller("deleteLater")
+
+
+@dataclass(frozen=True)
+class _PlatformConfig:
+    """Window setup for alert dialogs on the running platform."""
+
+    flags: WindowFlags
+    mac_attr: Optional[WidgetAttribute]
+    stylesheet: str
+
+
+def _build_platform_cfg() -> _PlatformConfig:
+    """Decide window flags, attribute and style sheet for the running platform."""
+    # Initialize base flags with proper type
+    flags: WindowFlags = QtConstants.Dialog | QtConstants.WindowStaysOnTopHint
+    if _IS_MAC:
+        # Use native window decorations on macOS
+        return _PlatformConfig(
+            flags,
+            QtConstants.WA_MacAlwaysShowToolWindow,
+            "QDialog { background-color: rgba(255, 255, 255, 0.95); }",
+        )
+    if _IS_WIN:
+        # Custom window frame on Windows
+        return _PlatformConfig(
+            flags | QtConstants.FramelessWindowHint,
+            None,
+            "QDialog { border: 2px solid rgba(255, 152, 152, 1); }",
+        )
+    # Default behavior for Linux
+    return _PlatformConfig(flags, None, "")
+
+
+def _add_all(layout: QBoxLayout, *items: Optional[QWidget]) -> None:
+    """Add widgets to a box layout in order; ``None`` adds a stretch."""
+    add_widget = layout.addWidget
+    for item in items:
+        if item is None:
+            layout.addStretch()
+        else:
+            add_widget(item)
+
+
+@lru_cache(maxsize=1)
+def _config_manager() -> ConfigManager:
+    """Get the configuration manager shared by every alert dialog.
+
+    Its load() re-reads the configuration file only after the file changes.
+    """
+    return ConfigManager()
+
+
+@lru_cache(maxsize=1)
+def _get_icon() -> QIcon:
+    """Get the application icon, loading the resource on first use (needs a QApplication)."""
+    return QIcon(":/Octopus.ico")
+
+
+@lru_cache(maxsize=1)
+def _get_title_pixmap() -> QPixmap:
+    """Get the 24x24 title bar rendering of the application icon."""
+    return _get_icon().pixmap(24, 24)
+
 
 class CustomDialog(QDialog):
     """
@@ -31,55 +109,51 @@ class CustomDialog(QDialog):
     3. Can be closed with a custom close button
     """
 
+    # Platform decisions are made once at import rather than for every dialog
+    _PLATFORM_CFG = _build_platform_cfg()
+
     def __init__(self, custom_message: str, parent: Optional[QWidget] = None) -> None:
         """Initialize dialog with platform-specific settings."""
         super().__init__(parent)
         self.resource_manager: ResourceManager = ResourceManager()
-        self.config_manager = ConfigManager()
+        self.config_manager = _config_manager()
         self.settings = self.config_manager.load()
-        self.notification_manager = NotificationManager()
+        # Created on first use so muted dialogs never open the audio backend
+        self._notification_manager: Optional[NotificationManager] = None
         self.drag_position: Optional[QPoint] = None
 
-        # Register resources with unique IDs
-        self.resource_manager.register(
-            resource_id="notification_manager",
-            resource=self.notification_manager,
-            cleanup_handler=lambda x: x.deleteLater(),
-        )
-
         self._setup_platform_specific()
         self.setup_ui(custom_message)
 
+    @property
+    def notification_manager(self) -> NotificationManager:
+        """Notification manager, created and registered for cleanup on first access."""
+        if self._notification_manager is None:
+            self._notification_manager = NotificationManager()
+
+            # Register resources with unique IDs
+            self.resource_manager.register(
+                resource_id="notification_manager",
+                resource=self._notification_manager,
+                cleanup_handler=_DELETE_LATER,
+            )
+        return self._notification_manager
+
     def _setup_platform_specific(self) -> None:
         """Configure platform-specific window behavior."""
-        system = platform.system()
+        cfg = self._PLATFORM_CFG
         try:
-            # Initialize base flags with proper type
-            flags: WindowFlags = QtConstants.Dialog | QtConstants.WindowStaysOnTopHint
-
-            if system == "Darwin":
-                # Use native window decorations on macOS
-                self.setWindowFlags(flags)
-                self.setAttribute(QtConstants.WA_MacAlwaysShowToolWindow)
-            elif system == "Windows":
-                # Custom window frame on Windows
-                flags = flags | QtConstants.FramelessWindowHint
-                self.setWindowFlags(flags)
-            else:
-                # Default behavior for Linux
-                self.setWindowFlags(flags)
-
-            # Set platform-specific style
-            if system == "Windows":
-                self.setStyleSheet("QDialog { border: 2px solid rgba(255, 152, 152, 1); }")
-            elif system == "Darwin":
-                # macOS specific styling
-                self.setStyleSheet("QDialog { background-color: rgba(255, 255, 255, 0.95); }")
-
+            self.setWindowFlags(cfg.flags)
+            if cfg.mac_attr is not None:
+                self.setAttribute(cfg.mac_attr)
         except Exception as e:
             logger.error(f"Failed to setup platform-specific settings: {e}")
             self.setWindowFlags(QtConstants.Dialog)  # Use simple dialog flags as fallback
 
+        # Set platform-specific style
+        if cfg.stylesheet:
+            self.setStyleSheet(cfg.stylesheet)
+
     def center_window(self) -> None:
         """Center the dialog window on the screen."""
         PlatformUI.center_window(self)
@@ -89,89 +163,49 @@ class CustomDialog(QDialog):
         Handle the show event.
 
         This method:
-        1. Loads settings
-        2. Plays notification sound if enabled
-        3. Centers the window
+        1. Plays notification sound if enabled
+        2. Centers the window before it is mapped, so it never appears and then jumps
         """
-        try:
-            self.load_settings()
-            if not self.settings.get("mute_sound", False):
+        if not self.settings.get("mute_sound", False):
+            try:
                 self.notification_manager.play_notification("default")
-            super().showEvent(event)
-            self.center_window()
-        except Exception as e:
-            logger.error(f"Show event error: {e}")
+            except Exception as e:
+                self._handle_notification_error(str(e))
+        self.adjustSize()
+        self.center_window()
+        super().showEvent(event)
 
     def closeEvent(self, event: Any) -> None:
         """Handle dialog close with proper cleanup."""
         try:
             self.resource_manager.cleanup(resource_id="notification_manager")
-            super().closeEvent(event)
         except Exception as e:
             logger.error(f"Close event error: {e}")
-            event.accept()
-
-    def load_settings(self) -> Dict[str, Any]:
-        """Load and validate settings from file.
-
-        Returns:
-            Dict containing settings or default values
-        """
-        default_settings = {
-            "version": "3.06",
-            "mute_sound": False,
-            # Add other default settings as needed
-        }
-
-        try:
-            if not Path("settings_jmo.json").exists():
-                return default_settings
-
-            with open("settings_jmo.json", "r", encoding="utf-8") as f:
-                settings = json.load(f)
-                return {**default_settings, **settings}  # Merge with defaults
-
-        except Exception as e:
-            logger.error(f"Failed to load settings: {e}")
-            return default_settings
+        super().closeEvent(event)
 
     def setup_ui(self, custom_message: str) -> None:
         """Set up the dialog UI with platform-specific styling."""
-        try:
-            self.setWindowTitle(f"Alert v{self.settings['version']}")
-            self.setWindowIcon(QIcon(":/Octopus.ico"))
+        self._title = f"Alert v{self.settings['version']}"
+        self.setWindowTitle(self._title)
+        self.setWindowIcon(_get_icon())
 
-            layout = QVBoxLayout()
-            self._setup_title_bar(layout)
-            self._setup_message_area(layout, custom_message)
-            self.setLayout(layout)
-
-        except Exception as e:
-            logger.error(f"Failed to setup dialog UI: {e}")
-            raise
+        layout = QVBoxLayout(self)
+        self._setup_title_bar(layout)
+        self._setup_message_area(layout, custom_message)
 
     def _setup_title_bar(self, layout: QVBoxLayout) -> None:
         """Set up custom title bar with platform-specific behavior."""
-        try:
-            if platform.system() != "Darwin":  # Skip on macOS
-                title_bar = QWidget()
-                title_layout = QHBoxLayout()
-
-                icon_label = QLabel()
-                icon_label.setPixmap(QIcon(":/Octopus.ico").pixmap(24, 24))
-                title_layout.addWidget(icon_label)
+        if _IS_MAC:  # Skip on macOS
+            return
 
-                title_label = QLabel(f"Alert v{self.settings['version']}")
-                title_layout.addWidget(title_label)
-                title_layout.addStretch()
+        title_bar = QWidget()
+        title_layout = QHBoxLayout(title_bar)
 
-                close_button = self._create_close_button()
-                title_layout.addWidget(close_button)
+        icon_label = QLabel()
+        icon_label.setPixmap(_get_title_pixmap())
+        _add_all(title_layout, icon_label, QLabel(self._title), None, self._create_close_button())
 
-                title_bar.setLayout(title_layout)
-                layout.addWidget(title_bar)
-        except Exception as e:
-            logger.error(f"Failed to setup title bar: {e}")
+        layout.addWidget(title_bar)
 
     def _create_close_button(self) -> QPushButton:
         """Create a close button with platform-specific styling."""
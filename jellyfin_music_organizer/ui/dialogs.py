@@ -1,7 +1,8 @@
 """Platform-specific dialog handling."""
 
 import logging
-import platform
+import os
+import sys
 from pathlib import Path
 from typing import Optional, Tuple
 
@@ -9,33 +10,38 @@ from PyQt5.QtWidgets import QFileDialog, QWidget
 
 logger = logging.getLogger(__name__)
 
+# Evaluated once; platform.system() may spawn a subprocess on Windows
+_IS_MAC = sys.platform == "darwin"
+
+# Default start directory; the home directory doesn't change while the app runs
+_HOME_STR = str(Path.home())
+
 
 class DialogManager:
     """Handle platform-specific dialog behavior."""
 
+    # Native dialogs are only used on macOS
+    _OPTIONS = (
+        QFileDialog.Options() if _IS_MAC else QFileDialog.Options(QFileDialog.DontUseNativeDialog)
+    )
+
     @staticmethod
     def get_folder_dialog(
         parent: QWidget, title: str, start_dir: Optional[Path] = None
     ) -> Optional[Path]:
         """Show platform-appropriate folder selection dialog."""
-        try:
-            options = QFileDialog.Options()
-            if platform.system() != "Darwin":
-                options |= QFileDialog.DontUseNativeDialog
-
-            if not start_dir:
-                start_dir = Path.home()
+        start_dir_str = str(start_dir) if start_dir else _HOME_STR
 
+        try:
             folder_path = QFileDialog.getExistingDirectory(
-                parent, title, str(start_dir), options=options
+                parent, title, start_dir_str, options=DialogManager._OPTIONS
             )
-
-            return Path(folder_path) if folder_path else None
-
         except Exception as e:
             logger.error(f"Folder dialog failed: {e}")
             return None
 
+        return Path(folder_path) if folder_path else None
+
     @staticmethod
     def get_save_file(
         parent: QWidget, title: str, filter_str: str, default_suffix: str
@@ -52,23 +58,19 @@ class DialogManager:
             Tuple of (selected file path or None, selected filter)
         """
         try:
-            options = QFileDialog.Options()
-
-            if platform.system() != "Darwin":  # Non-macOS
-                options |= QFileDialog.DontUseNativeDialog
-
             file_name, selected_filter = QFileDialog.getSaveFileName(
-                parent, title, str(Path.home()), filter_str, options=options
+                parent, title, _HOME_STR, filter_str, options=DialogManager._OPTIONS
             )
-
-            if file_name:
-                path = Path(file_name)
-                if not path.suffix:
-                    path = path.with_suffix(default_suffix)
-                return path, selected_filter
-
-            return None, ""
-
         except Exception as e:
             logger.error(f"Save file dialog failed: {e}")
             return None, ""
+
+        if not file_name:
+            return None, ""
+
+        if not os.path.splitext(file_name)[1]:
+            # Append to the string rather than rebuilding the path with with_suffix()
+            if not default_suffix.startswith("."):
+                default_suffix = f".{default_suffix}"
+            file_name += default_suffix
+        return Path(file_name), selected_filter
@@ -1,20 +1,33 @@
-import csv
-import json
 import os
 import platform
+from collections import OrderedDict
+from functools import partial
+from itertools import chain
 from logging import getLogger
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Set, Union
-
-import openpyxl
-from PyQt5.QtCore import QByteArray, QSettings, Qt, QTimer, pyqtSignal
-from PyQt5.QtGui import QIcon
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union, cast
+
+from PyQt5.QtCore import (
+    QAbstractListModel,
+    QByteArray,
+    QModelIndex,
+    QObject,
+    QRect,
+    QRunnable,
+    QSettings,
+    Qt,
+    QThreadPool,
+    QTimer,
+    pyqtSignal,
+)
+from PyQt5.QtGui import QIcon, QTextDocument
 from PyQt5.QtWidgets import (
     QApplication,
     QFileDialog,
     QHBoxLayout,
     QLabel,
-    QListWidget,
+    QListView,
     QPushButton,
     QSizeGrip,
     QSizePolicy,
@@ -24,6 +37,7 @@ from PyQt5.QtWidgets import (
 )
 from typing_extensions import TypeAlias
 
+from ..utils import json_compat
 from ..utils.dialogs import DialogManager
 from ..utils.notifications import NotificationManager
 from ..utils.platform_utils import PlatformUI
@@ -34,6 +48,84 @@ logger = getLogger(__name__)
 
 # Type definitions
 ErrorDict: TypeAlias = Dict[str, Union[str, List[str], Dict[str, str]]]
+# (max metadata fields, sorted metadata keys, keys shared by every entry)
+MetadataSummary: TypeAlias = Tuple[int, List[str], bool]
+
+# Laid-out details documents kept for recently viewed rows
+_DOC_CACHE_SIZE = 64
+
+
+class _ExportSignals(QObject):
+    """Signals reporting the outcome of an export task."""
+
+    finished = pyqtSignal(str)  # Path of the written file
+    failed = pyqtSignal(str)  # Error description
+
+
+class _ExportTask(QRunnable):
+    """Write an error report on a pool thread so the window stays responsive."""
+
+    def __init__(
+        self, save_function: Callable[[str], None], file_path: str, parent: QObject
+    ) -> None:
+        """Initialize the export task.
+
+        Args:
+            save_function: Function writing the report to the given path
+            file_path: Destination of the report
+            parent: Owner of the signals object, which lives in the GUI thread
+        """
+        super().__init__()
+        self.save_function = save_function
+        self.file_path = file_path
+        self.signals = _ExportSignals(parent)
+        # The signals object is only needed until one of the outcomes is delivered
+        self.signals.finished.connect(self.signals.deleteLater)
+        self.signals.failed.connect(self.signals.deleteLater)
+
+    def run(self) -> None:
+        """Write the report and report the outcome."""
+        try:
+            self.save_function(self.file_path)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.finished.emit(self.file_path)
+
+
+class ErrorFileListModel(QAbstractListModel):
+    """List model exposing the file names of error entries to a QListView.
+
+    The view asks for rows on demand, so no per-item Qt objects are created.
+    """
+
+    def __init__(self, error_files: List[ErrorDict], parent: Any = None) -> None:
+        """Initialize the model.
+
+        Args:
+            error_files: Error entries to expose; the list is referenced, not copied
+            parent: Optional parent QObject
+        """
+        super().__init__(parent)
+        self.error_files = error_files
+
+    def set_error_files(self, error_files: List[ErrorDict]) -> None:
+        """Replace the error entries and reset attached views."""
+        self.beginResetModel()
+        self.error_files = error_files
+        self.endResetModel()
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Return the number of error entries (zero for child indexes)."""
+        if parent.isValid():
+            return 0
+        return len(self.error_files)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        """Return the file name of the entry at ``index`` for the display role."""
+        if role != Qt.ItemDataRole.DisplayRole or not index.isValid():
+            return None
+        return str(self.error_files[index.row()]["file_name"])
 
 
 class MusicErrorWindow(QWidget):
@@ -57,10 +149,36 @@ class MusicErrorWindow(QWidget):
         self.error_text = QTextEdit(self)  # Add error text widget
         self.error_details = QTextEdit(self)  # Add error details widget
 
+        # Application-wide objects looked up once; the screen size follows geometry changes
+        self._clipboard = QApplication.clipboard()
+        self._screen_geometry: Optional[QRect] = None
+        screen = QApplication.primaryScreen()
+        if screen is not None:
+            self._screen_geometry = screen.geometry()
+            screen.geometryChanged.connect(self._on_screen_geometry_changed)
+
         if not self._validate_error_files(error_files):
             raise ValueError("Invalid error files format")
 
-        self.error_files = error_files
+        self.error_files = self._preprocess_error_files(error_files)
+        # Computed on the GUI thread at the first export, then handed to the export task
+        self._meta_summary_cache: Optional[MetadataSummary] = None
+        # Details text for each entry, aligned with error_files; the entries never change
+        self._details_cache: List[str] = [
+            self._format_details_text(info) for info in self.error_files
+        ]
+
+        # Selection changes are coalesced so only the last row of an event-loop pass is rendered
+        self._pending_row: Optional[int] = None
+        self._render_timer = QTimer(self)
+        self._render_timer.setSingleShot(True)
+        self._render_timer.setInterval(0)
+        self._render_timer.timeout.connect(self._render_pending_details)
+        # Row -> details document, least recently shown first
+        self._doc_cache: "OrderedDict[int, QTextDocument]" = OrderedDict()
+        # Exports still running, and whether the window was closed while they finish
+        self._exports_running = 0
+        self._closed = False
         self._setup_platform_specific()
         self.setup_ui()
 
@@ -82,11 +200,38 @@ class MusicErrorWindow(QWidget):
         try:
             self.window_state.save_state(self)
             super().closeEvent(event)
+            self._closed = True
+            if not self._exports_running:
+                self._dispose()
         except Exception as e:
             logger.error(f"Close event error: {e}")
             event.accept()
             return None  # Explicit return for error case
 
+    def _dispose(self) -> None:
+        """Release a closed window's data and delete it.
+
+        The window manager keeps a window until it is destroyed, so the next error
+        report builds a fresh window instead of re-showing this emptied one.
+        """
+        self._release_caches()
+        self.deleteLater()
+
+    def _release_caches(self) -> None:
+        """Drop the error entries and everything derived from them once the window closes."""
+        self._render_timer.stop()
+        self._pending_row = None
+        self.error_files = []
+        self._details_cache = []
+        self._meta_summary_cache = None
+        self.file_list_model.set_error_files(self.error_files)
+
+        # Give the details pane its own document before releasing the cached ones
+        self.details_display.setDocument(QTextDocument(self.details_display))
+        for doc in self._doc_cache.values():
+            doc.deleteLater()
+        self._doc_cache.clear()
+
     def setup_titlebar(self) -> None:
         """Set up the custom titlebar."""
         # Hides the default titlebar
@@ -166,10 +311,15 @@ class MusicErrorWindow(QWidget):
             hbox_list_text_layout = QHBoxLayout()
             vbox_main_layout.addLayout(hbox_list_text_layout)
 
-            # Create the file list widget on the top
-            self.file_list_widget = QListWidget(self)
-            hbox_list_text_layout.addWidget(self.file_list_widget)
-            self.file_list_widget.currentItemChanged.connect(self.displayDetails)
+            # Create the file list view on the top; rows are rendered lazily from the model
+            self.file_list_model = ErrorFileListModel(self.error_files, self)
+            self.file_list_view = QListView(self)
+            self.file_list_view.setUniformItemSizes(True)
+            self.file_list_view.setLayoutMode(QListView.Batched)
+            self.file_list_view.setBatchSize(100)
+            self.file_list_view.setModel(self.file_list_model)
+            hbox_list_text_layout.addWidget(self.file_list_view)
+            self.file_list_view.selectionModel().currentChanged.connect(self.displayDetails)
 
             # QLabel for text details
             text_label = QLabel(self)
@@ -236,7 +386,7 @@ class MusicErrorWindow(QWidget):
                 Qt.AlignmentFlag.AlignBottom | Qt.AlignmentFlag.AlignRight,
             )
 
-            # Populate QListWidget
+            # Populate QListView
             self.populate_list_widget()
 
         except Exception as e:
@@ -246,11 +396,10 @@ class MusicErrorWindow(QWidget):
     def center_window(self) -> None:
         """Center the window on the screen."""
         try:
-            desktop = QApplication.desktop()
-            if desktop is None:
-                raise RuntimeError("Failed to get desktop")
+            screen = self._screen_geometry
+            if screen is None:
+                raise RuntimeError("Failed to get screen geometry")
 
-            screen = desktop.screenGeometry()
             window_size = self.geometry()
             x = (screen.width() - window_size.width()) // 2
             y = (screen.height() - window_size.height()) // 2
@@ -258,65 +407,63 @@ class MusicErrorWindow(QWidget):
         except Exception as e:
             logger.error(f"Failed to center window: {e}")
 
+    def _on_screen_geometry_changed(self, geometry: QRect) -> None:
+        """Keep the cached screen geometry used for centering up to date."""
+        self._screen_geometry = geometry
+
     def populate_list_widget(self) -> None:
-        """Populate the list widget with error files."""
+        """Populate the list view with error files."""
         try:
             if not self.error_files:
                 logger.warning("No error files to populate list widget")
                 return
 
-            self.file_list_widget.clear()
-            for info in self.error_files:
-                try:
-                    file_name = info.get("file_name")
-                    if not file_name:
-                        logger.warning("Found error info without file name")
-                        continue
-                    self.file_list_widget.addItem(str(file_name))
-                except Exception as e:
-                    logger.error(f"Failed to add item to list widget: {e}")
-                    continue
-
-            if self.file_list_widget.count() > 0:
-                self.file_list_widget.setCurrentRow(0)
-            else:
-                logger.warning("No valid items added to list widget")
+            self.file_list_model.set_error_files(self.error_files)
+            self.file_list_view.setCurrentIndex(self.file_list_model.index(0))
 
         except Exception as e:
             logger.error(f"Failed to populate list widget: {e}")
             self.custom_dialog_signal.emit("Failed to populate file list")
 
-    def displayDetails(self, current_item: Any) -> None:
-        """Display details for the selected item.
+    def displayDetails(self, current: QModelIndex, previous: Optional[QModelIndex] = None) -> None:
+        """Display details for the selected row.
 
         Args:
-            current_item: The currently selected item in the list widget.
+            current: Model index of the newly selected row.
+            previous: Model index of the previously selected row (unused).
         """
         try:
-            if current_item is None:
+            if not current.isValid():
                 logger.debug("No item selected")
                 return
 
-            selected_file = current_item.text()
-            if not selected_file:
-                logger.warning("Selected item has no text")
-                return
-
-            selected_info = next(
-                (info for info in self.error_files if info["file_name"] == selected_file), None
-            )
-
-            if not selected_info:
-                logger.warning(f"No error info found for file: {selected_file}")
-                return
-
-            details_text = self._format_details_text(selected_info)
-            self.details_display.setPlainText(details_text)
+            self._pending_row = current.row()
+            self._render_timer.start()
 
         except Exception as e:
             logger.error(f"Failed to display details: {e}")
             self.custom_dialog_signal.emit("Failed to display file details")
 
+    def _render_pending_details(self) -> None:
+        """Show the details of the most recently selected row."""
+        row = self._pending_row
+        if row is None:
+            return
+        self._pending_row = None
+
+        # Swapping in a cached document skips re-parsing and re-laying out the text
+        doc = self._doc_cache.get(row)
+        if doc is None:
+            doc = QTextDocument(self)
+            doc.setDefaultFont(self.details_display.font())
+            doc.setPlainText(self._details_cache[row])
+            self._doc_cache[row] = doc
+            if len(self._doc_cache) > _DOC_CACHE_SIZE:
+                self._doc_cache.popitem(last=False)[1].deleteLater()
+        else:
+            self._doc_cache.move_to_end(row)
+        self.details_display.setDocument(doc)
+
     def _format_details_text(self, info: Dict[str, Any]) -> str:
         """Format the details text for display.
 
@@ -327,25 +474,22 @@ class MusicErrorWindow(QWidget):
             Formatted text string for display.
         """
         try:
-            details = []
-            details.append(f"File Name: {info['file_name']}")
-            details.append(f"Error: {info['error']}")
-
             artist_found = info["artist_found"]
             album_found = info["album_found"]
-
-            details.append(f"Artist Found: {artist_found[0] if artist_found else 'False'}")
-            details.append(f"Album Found: {album_found[0] if album_found else 'False'}\n")
-
-            details.append("Metadata:")
             metadata_dict = info["metadata_dict"]
-            if metadata_dict:
-                for key, value in metadata_dict.items():
-                    details.append(f"{key}: {value}")
-            else:
-                details.append("No metadata available")
+            metadata_text = (
+                "\n".join([f"{key}: {value}" for key, value in metadata_dict.items()])
+                if metadata_dict
+                else "No metadata available"
+            )
 
-            return "\n".join(details)
+            return (
+                f"File Name: {info['file_name']}\n"
+                f"Error: {info['error']}\n"
+                f"Artist Found: {artist_found[0] if artist_found else 'False'}\n"
+                f"Album Found: {album_found[0] if album_found else 'False'}\n\n"
+                f"Metadata:\n{metadata_text}"
+            )
 
         except Exception as e:
             logger.error(f"Failed to format details text: {e}")
@@ -354,7 +498,7 @@ class MusicErrorWindow(QWidget):
     def copyDetails(self) -> None:
         """Copy the details to clipboard."""
         try:
-            clipboard = QApplication.clipboard()
+            clipboard = self._clipboard
             if clipboard is None:
                 raise RuntimeError("Failed to get clipboard")
 
@@ -403,7 +547,7 @@ class MusicErrorWindow(QWidget):
         self._save_file_with_dialog(
             "Save CSV",
             "CSV Files (*.csv)",
-            self._generate_csv_content,
+            partial(self._generate_csv_content, summary=self._metadata_summary()),
             "An error occurred while generating the CSV file.",
             self.csv_button,
         )
@@ -463,33 +607,36 @@ class MusicErrorWindow(QWidget):
             file_name: Path to save the text file.
         """
         with open(file_name, "w", encoding="utf-8") as file:
-            for info in self.error_files:
-                file.write(self._format_details_text(info))
+            for details_text in self._details_cache:
+                file.write(details_text)
                 file.write("\n\n")
 
-    def _generate_csv_content(self, file_name: str) -> None:
+    def _generate_csv_content(
+        self, file_name: str, summary: Optional[MetadataSummary] = None
+    ) -> None:
         """Generate CSV file content.
 
         Args:
             file_name: Path to save the CSV file.
+            summary: Metadata summary; required when called off the GUI thread.
         """
-        rows = []
-        max_metadata_fields = max(len(info["metadata_dict"]) for info in self.error_files)
+        import csv  # Only needed when exporting
 
-        # Generate rows
-        for info in self.error_files:
-            try:
-                row = self._process_csv_row(info)
-                rows.append(row)
-            except Exception as e:
-                logger.error(f"Failed to process CSV row: {e}")
-                continue
+        max_metadata_fields = (summary or self._metadata_summary())[0]
 
-        # Write to CSV file
-        with open(file_name, mode="w", encoding="utf-8-sig", newline="") as file:
-            writer = csv.writer(file)
+        # Rows are written as they are built, so only one is held at a time; the large
+        # buffer batches them into few writes and the BOM lets Excel detect UTF-8
+        with open(file_name, mode="w", encoding="utf-8", newline="", buffering=1 << 20) as file:
+            file.write("\ufeff")
+            writer = csv.writer(file, lineterminator="\n")
             writer.writerow(self._generate_csv_header(max_metadata_fields))
-            writer.writerows(rows)
+            for info in self.error_files:
+                try:
+                    row = self._process_csv_row(info)
+                except Exception as e:
+                    logger.error(f"Failed to process CSV row: {e}")
+                    continue
+                writer.writerow(row)
 
     def _generate_json_content(self, file_name: str) -> None:
         """Generate JSON file content.
@@ -497,17 +644,20 @@ class MusicErrorWindow(QWidget):
         Args:
             file_name: Path to save the JSON file.
         """
-        data = []
-        for info in self.error_files:
-            try:
-                row_data = self._process_json_data(info)
-                data.append(row_data)
-            except Exception as e:
-                logger.error(f"Failed to process JSON data: {e}")
-                continue
-
-        with open(file_name, "w", encoding="utf-8") as file:
-            json.dump(data, file, indent=4, ensure_ascii=False)
+        # Records are emitted one at a time as a 2-space indented array (orjson when installed)
+        with open(file_name, "wb") as file:
+            file.write(b"[")
+            separator = b"\n  "
+            for info in self.error_files:
+                try:
+                    row_data = self._process_json_data(info)
+                except Exception as e:
+                    logger.error(f"Failed to process JSON data: {e}")
+                    continue
+                file.write(separator)
+                file.write(json_compat.dumps(row_data).replace(b"\n", b"\n  "))
+                separator = b",\n  "
+            file.write(b"]" if separator == b"\n  " else b"\n]")
 
     def _process_csv_row(self, info: Dict[str, Any]) -> List[str]:
         """Process a single row for CSV output.
@@ -520,16 +670,14 @@ class MusicErrorWindow(QWidget):
         """
         metadata_dict = self._format_metadata(info["metadata_dict"])
 
-        artist_found = info["artist_found"][0] if info["artist_found"] else "None"
-        album_found = info["album_found"][0] if info["album_found"] else "None"
-
-        row = [info["file_name"], info["error"], artist_found, album_found]
-
-        # Add metadata
-        for key, value in metadata_dict.items():
-            row.extend([key, value])
-
-        return row
+        # Metadata follows as flattened key, value pairs
+        return [
+            info["file_name"],
+            info["error"],
+            info["_artist0"],
+            info["_album0"],
+            *chain.from_iterable(metadata_dict.items()),
+        ]
 
     def _process_json_data(self, info: Dict[str, Any]) -> Dict[str, Any]:
         """Process data for JSON output.
@@ -542,14 +690,11 @@ class MusicErrorWindow(QWidget):
         """
         metadata_dict = self._format_metadata(info["metadata_dict"])
 
-        artist_found = info["artist_found"][0] if info["artist_found"] else "False"
-        album_found = info["album_found"][0] if info["album_found"] else "False"
-
         return {
             "filename": info["file_name"],
             "error": info["error"],
-            "artist_found": artist_found,
-            "album_found": album_found,
+            "artist_found": info["_artist0"],
+            "album_found": info["_album0"],
             "metadata_dict": metadata_dict,
         }
 
@@ -562,46 +707,25 @@ class MusicErrorWindow(QWidget):
         Returns:
             Dictionary with string values
         """
-        try:
-            if not self._validate_metadata_dict(metadata_dict):
-                logger.warning("Invalid metadata dictionary")
-                return {}
-
-            return {
-                str(key): str(value) for key, value in metadata_dict.items() if value is not None
-            }
-        except Exception as e:
-            logger.error(f"Failed to format metadata: {e}")
+        if not isinstance(metadata_dict, dict):
+            logger.warning("Invalid metadata dictionary")
             return {}
 
-    def _validate_metadata_dict(self, metadata_dict: Dict[str, Any]) -> bool:
-        """Validate metadata dictionary structure.
-
-        Args:
-            metadata_dict: Dictionary containing metadata.
-
-        Returns:
-            True if valid, False otherwise.
-        """
-        try:
-            if not isinstance(metadata_dict, dict):
-                return False
-
-            # Check all values can be converted to strings
-            for value in metadata_dict.values():
-                try:
-                    str(value)
-                except Exception:
-                    return False
-
-            return True
-
-        except Exception as e:
-            logger.error(f"Metadata validation error: {e}")
-            return False
+        # Values are validated and converted in the same pass
+        formatted: Dict[str, str] = {}
+        for key, value in metadata_dict.items():
+            if value is None:
+                continue
+            try:
+                formatted[str(key)] = str(value)
+            except Exception as e:
+                logger.warning(f"Invalid metadata dictionary: {e}")
+                return {}
+        return formatted
 
     def update_error_list(self, error_list: List[ErrorDict]) -> None:
         """Update the error list widget with new errors."""
+        self._meta_summary_cache = None
         self.error_list = error_list
         self.current_error_index = 0
         self.update_current_error()
@@ -646,54 +770,76 @@ class MusicErrorWindow(QWidget):
             if not file_name:
                 return
 
-            wb = openpyxl.Workbook()
-            ws = wb.active
+            self._start_export(
+                partial(self._generate_excel_content, summary=self._metadata_summary()),
+                file_name,
+                self._on_excel_saved,
+                self._on_excel_failed,
+            )
+
+        except Exception as e:
+            self._on_excel_failed(str(e))
+
+    def _generate_excel_content(
+        self, file_name: str, summary: Optional[MetadataSummary] = None
+    ) -> None:
+        """Generate Excel file content.
 
-            headers = self._generate_excel_headers()
-            ws.append(headers)
+        Args:
+            file_name: Path to save the Excel file.
+            summary: Metadata summary; required when called off the GUI thread.
+        """
+        if summary is None:
+            summary = self._metadata_summary()
+        import openpyxl  # Heavy; loaded on the first Excel export only
 
-            for row_data in self._generate_excel_rows():
-                ws.append(row_data)
+        # Write-only mode streams rows to the sheet XML instead of keeping every cell
+        wb = openpyxl.Workbook(write_only=True)
+        ws = wb.create_sheet()
 
-            self._save_excel_file(wb, file_name)
-            self._update_button_status(self.excel_button, "Excel File Generated!")
+        headers = self._generate_excel_headers(summary)
+        ws.append(headers)
 
-        except Exception as e:
-            logger.error(f"Failed to generate Excel file: {e}")
-            self.custom_dialog_signal.emit("Failed to generate Excel file")
-            self._update_button_status(self.excel_button, "Excel Generation Failed!")
+        for row_data in self._generate_excel_rows(summary):
+            ws.append(row_data)
+
+        wb.save(file_name)  # Errors reach the export task, which reports the failure
 
-    def _generate_excel_headers(self) -> List[str]:
+    def _on_excel_saved(self, file_name: str) -> None:
+        """Show that the Excel export finished."""
+        self._update_button_status(self.excel_button, "Excel File Generated!")
+
+    def _on_excel_failed(self, error: str) -> None:
+        """Report a failed Excel export."""
+        logger.error(f"Failed to generate Excel file: {error}")
+        self.custom_dialog_signal.emit("Failed to generate Excel file")
+        self._update_button_status(self.excel_button, "Excel Generation Failed!")
+
+    def _generate_excel_headers(self, summary: MetadataSummary) -> List[str]:
         """Generate Excel headers with metadata columns."""
         base_headers = ["Filename", "Error", "Artist Found", "Album Found"]
-        metadata_headers = self._get_unique_metadata_keys()
-        return base_headers + metadata_headers
-
-    def _generate_excel_rows(self) -> List[List[str]]:
-        """Generate Excel rows with proper formatting."""
-        rows = []
+        return base_headers + summary[1]
+
+    def _generate_excel_rows(self, summary: MetadataSummary) -> Iterator[List[str]]:
+        """Yield Excel rows with proper formatting, one at a time."""
+        _, metadata_keys, uniform_keys = summary
+        get_values: Callable[[Dict[str, Any]], Iterable[Any]]
+        if uniform_keys and len(metadata_keys) > 1:
+            # Every entry has exactly the header keys, so one C-level getter reads them all
+            get_values = itemgetter(*metadata_keys)
+        else:
+            get_values = partial(self._get_metadata_values, metadata_keys)
         for info in self.error_files:
             try:
-                row = self._format_excel_row(info)
-                rows.append(row)
+                yield self._format_excel_row(info, get_values)
             except Exception as e:
                 logger.error(f"Failed to format row for {info.get('file_name', 'unknown')}: {e}")
-                continue
-        return rows
 
     def _get_save_filename(self, file_filter: str) -> str:
         """Get a valid save filename from the user."""
         file_name, _ = QFileDialog.getSaveFileName(self, "Save Excel", "", file_filter)
         return file_name
 
-    def _save_excel_file(self, wb: openpyxl.Workbook, file_name: str) -> None:
-        """Save the Excel workbook to a file."""
-        try:
-            wb.save(file_name)
-        except Exception as e:
-            logger.error(f"Failed to save Excel file: {e}")
-            self.custom_dialog_signal.emit("Failed to save Excel file")
-
     def _update_button_status(self, button: QPushButton, status: str) -> None:
         """Update the button text and style to reflect the status."""
         button.setText(status)
@@ -706,25 +852,60 @@ class MusicErrorWindow(QWidget):
 
     def _get_unique_metadata_keys(self) -> List[str]:
         """Get a list of unique metadata keys from all error files."""
-        keys: Set[str] = set()
-        for info in self.error_files:
-            metadata = info.get("metadata_dict", {})
-            if isinstance(metadata, dict):
-                keys.update(metadata.keys())
-        return sorted(list(keys))
-
-    def _format_excel_row(self, info: Dict[str, Any]) -> List[str]:
-        """Format a single row for Excel output."""
-        row = [
+        return self._metadata_summary()[1]
+
+    def _metadata_summary(self) -> MetadataSummary:
+        """Get the largest metadata field count and the sorted union of metadata keys.
+
+        Both are gathered in a single pass over the error files and cached until
+        the error list changes.
+
+        Returns:
+            Tuple of (maximum number of metadata fields, sorted unique metadata keys,
+            whether every entry has exactly those keys)
+        """
+        if self._meta_summary_cache is None:
+            max_len = 0
+            min_len: Optional[int] = None
+            keys: Set[str] = set()
+            for info in self.error_files:
+                metadata = info.get("metadata_dict", {})
+                if isinstance(metadata, dict):
+                    length = len(metadata)
+                    max_len = max(max_len, length)
+                    min_len = length if min_len is None else min(min_len, length)
+                    keys.update(metadata.keys())
+            # Each entry's keys are a subset of the union, so equal sizes mean equal key sets
+            self._meta_summary_cache = (max_len, sorted(keys), min_len == len(keys))
+        return self._meta_summary_cache
+
+    @staticmethod
+    def _get_metadata_values(
+        metadata_keys: List[str], metadata_dict: Dict[str, Any]
+    ) -> Iterable[Any]:
+        """Get an entry's metadata values in header order, None for missing keys."""
+        return map(metadata_dict.get, metadata_keys)
+
+    def _format_excel_row(
+        self, info: Dict[str, Any], get_values: Callable[[Dict[str, Any]], Iterable[Any]]
+    ) -> List[str]:
+        """Format a single row for Excel output.
+
+        Args:
+            info: Dictionary containing file information.
+            get_values: Returns the metadata values matching the header columns.
+
+        Returns:
+            Row values with one metadata cell per header key (empty when missing).
+        """
+        metadata_values = get_values(info["metadata_dict"])
+        return [
             info["file_name"],
             info["error"],
-            info["artist_found"][0] if info["artist_found"] else "None",
-            info["album_found"][0] if info["album_found"] else "None",
+            info["_artist0"],
+            info["_album0"],
+            *["" if value is None else str(value) for value in metadata_values],
         ]
-        metadata_dict = self._format_metadata(info["metadata_dict"])
-        for key, value in metadata_dict.items():
-            row.append(str(value))
-        return row
 
     def saveWindowState(self) -> None:
         """Save the current window state."""
@@ -787,6 +968,33 @@ class MusicErrorWindow(QWidget):
             logger.error(f"Error validating error files: {e}")
             return False
 
+    @staticmethod
+    def _preprocess_error_files(error_files: List[ErrorDict]) -> List[ErrorDict]:
+        """Copy the entries with the export value of their artist and album match.
+
+        Each copy gets ``_artist0`` and ``_album0`` set to the first match, or
+        ``"None"`` when nothing was found, so the export rows can read them
+        directly. The caller's entries are left untouched.
+
+        Args:
+            error_files: Validated error entries.
+
+        Returns:
+            List[ErrorDict]: Shallow copies of the entries with the extra keys.
+        """
+        processed: List[ErrorDict] = []
+        for error_file in error_files:
+            artist_found = cast(List[str], error_file["artist_found"])
+            album_found = cast(List[str], error_file["album_found"])
+            processed.append(
+                {
+                    **error_file,
+                    "_artist0": artist_found[0] if artist_found else "None",
+                    "_album0": album_found[0] if album_found else "None",
+                }
+            )
+        return processed
+
     def _configure_button(
         self,
         button: QPushButton,
@@ -833,15 +1041,53 @@ class MusicErrorWindow(QWidget):
         error_message: str,
         success_button: QPushButton,
     ) -> None:
-        """Save file with proper error handling and UI feedback."""
-        try:
-            save_function(file_path)
-            success_button.setEnabled(False)
-            success_button.setText("Generated")
-            self.custom_dialog_signal.emit(f"File saved successfully: {file_path}")
-        except Exception as e:
-            logger.error(f"Failed to save file: {e}")
-            self.custom_dialog_signal.emit(f"{error_message}: {str(e)}")
+        """Save file in the background with proper error handling and UI feedback."""
+        self._start_export(
+            save_function,
+            file_path,
+            partial(self._on_file_saved, success_button),
+            partial(self._on_file_save_failed, error_message),
+        )
+
+    def _start_export(
+        self,
+        save_function: Callable[[str], None],
+        file_path: str,
+        on_finished: Callable[[str], None],
+        on_failed: Callable[[str], None],
+    ) -> None:
+        """Run an export function on the global thread pool.
+
+        Args:
+            save_function: Function writing the report to the given path
+            file_path: Destination of the report
+            on_finished: Called in the GUI thread with the path once the report is written
+            on_failed: Called in the GUI thread with the error if writing fails
+        """
+        task = _ExportTask(save_function, file_path, self)
+        task.signals.finished.connect(on_finished)
+        task.signals.failed.connect(on_failed)
+        task.signals.finished.connect(self._on_export_done)
+        task.signals.failed.connect(self._on_export_done)
+        self._exports_running += 1
+        QThreadPool.globalInstance().start(task)
+
+    def _on_export_done(self, _result: str) -> None:
+        """Delete a closed window once its last running export has reported back."""
+        self._exports_running -= 1
+        if self._closed and not self._exports_running:
+            self._dispose()
+
+    def _on_file_saved(self, success_button: QPushButton, file_path: str) -> None:
+        """Update the export button once the file is written."""
+        success_button.setEnabled(False)
+        success_button.setText("Generated")
+        self.custom_dialog_signal.emit(f"File saved successfully: {file_path}")
+
+    def _on_file_save_failed(self, error_message: str, error: str) -> None:
+        """Report a failed export."""
+        logger.error(f"Failed to save file: {error}")
+        self.custom_dialog_signal.emit(f"{error_message}: {error}")
 
     def _generate_csv_header(self, max_metadata_fields: int) -> List[str]:
         """Generate CSV file header based on the maximum number of metadata fields.
@@ -854,10 +1100,9 @@ class MusicErrorWindow(QWidget):
         """
         header = ["File Name", "Error", "Artist Found", "Album Found"]
         header.extend(
-            [
-                f"Key {i//2 + 1}" if i % 2 == 0 else f"Value {i//2 + 1}"
-                for i in range(max_metadata_fields * 2)
-            ]
+            chain.from_iterable(
+                (f"Key {n}", f"Value {n}") for n in range(1, max_metadata_fields + 1)
+            )
         )
         return header
 
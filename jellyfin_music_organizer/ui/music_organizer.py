@@ -2,13 +2,13 @@
 Main window for the Jellyfin Music Organizer application.
 """
 
-import json
 import platform
+from functools import lru_cache
 from logging import getLogger
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QFont, QIcon
+from PyQt5.QtCore import QObject, QPoint, Qt, QTimer
+from PyQt5.QtGui import QFont, QIcon, QPixmap
 from PyQt5.QtWidgets import (
     QApplication,
     QFileDialog,
@@ -26,19 +26,37 @@ from PyQt5.QtWidgets import (
 
 # Other classes within files
 from ..core.organize_thread import OrganizeThread
-from ..utils.config import ConfigManager
+from ..utils.config import ConfigManager, get_settings
 from ..utils.notifications import NotificationManager
 from ..utils.platform_utils import PlatformUI
 from ..utils.qt_compat import QtCompat
 from ..utils.qt_types import QtConstants, WindowFlags
 from ..utils.window_manager import WindowManager
 from .custom_dialog import CustomDialog
-from .music_error_window import MusicErrorWindow
-from .replace_skip_window import ReplaceSkipWindow
-from .settings_window import SettingsWindow
 
 logger = getLogger(__name__)
 
+# Host platform name, resolved once rather than per window
+_SYSTEM = platform.system()
+
+
+@lru_cache(maxsize=1)
+def _get_icon() -> QIcon:
+    """Get the application icon, loading the resource on first use (needs a QApplication)."""
+    return QIcon(":/Octopus.ico")
+
+
+@lru_cache(maxsize=1)
+def _get_title_pixmap() -> QPixmap:
+    """Get the 24x24 title bar rendering of the application icon."""
+    return _get_icon().pixmap(24, 24)
+
+
+@lru_cache(maxsize=8)
+def _get_font(family: str, size: int) -> QFont:
+    """Get a shared font for a family and point size, resolving it on first use."""
+    return QFont(family, size)
+
 
 class MusicOrganizer(QWidget):
     """
@@ -51,6 +69,34 @@ class MusicOrganizer(QWidget):
     4. Shows progress and results
     """
 
+    # Progress bar style once organizing is complete, and the default style
+    _PROGRESS_FULL_QSS = """
+        QProgressBar {
+            border: 1px solid black;
+            text-align: center;
+            color: black;
+            background-color: rgba(255, 152, 152, 1);
+        }
+
+        QProgressBar::chunk {
+            background-color: rgba(255, 152, 152, 1);
+        }
+    """
+    _PROGRESS_EMPTY_QSS = ""
+
+    # Font family and size for this platform, identical for every instance
+    _FONT_SETTINGS: Dict[str, Any] = PlatformUI.get_font_settings()
+
+    # Title bar label and buttons, styled through one sheet on the title bar
+    _TITLEBAR_QSS = (
+        "QLabel#TitleLabel { color: white; }"
+        "QPushButton#SettingsBtn, QPushButton#MinBtn, QPushButton#CloseBtn"
+        " { color: white; background-color: transparent; }"
+        "QPushButton#SettingsBtn:hover { background-color: blue; }"
+        "QPushButton#MinBtn:hover { background-color: green; }"
+        "QPushButton#CloseBtn:hover { background-color: red; }"
+    )
+
     def __init__(self) -> None:
         """Initialize the MusicOrganizer window."""
         super().__init__()
@@ -67,6 +113,28 @@ class MusicOrganizer(QWidget):
         self.music_folder_path: str = ""
         self.destination_folder_path: str = ""
 
+        # Worker threads, present only while they are running
+        self.organize_thread: Optional[OrganizeThread] = None
+        self.notification_thread: Optional[QObject] = None
+
+        # Progress repaints are throttled to one per interval (~30 Hz); the last value always lands
+        self._progress_pending: Optional[int] = None
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.setInterval(33)
+        self._progress_timer.timeout.connect(self._flush_progress)
+        self._progress_style_full = False
+
+        # Title bar dragging state
+        self.draggable = False
+        self.offset = QPoint()
+        # Window moves are coalesced to one per timer interval while dragging
+        self._pending_drag_pos: Optional[QPoint] = None
+        self._drag_timer = QTimer(self)
+        self._drag_timer.setSingleShot(True)
+        self._drag_timer.setInterval(8)
+        self._drag_timer.timeout.connect(self._apply_drag)
+
         # Setup and show user interface
         self.setup_ui()
 
@@ -101,16 +169,17 @@ class MusicOrganizer(QWidget):
         self.title_bar: QWidget = QWidget(self)
         self.title_bar.setObjectName("TitleBar")
         self.title_bar.setFixedHeight(32)
+        self.title_bar.setStyleSheet(self._TITLEBAR_QSS)
 
         hbox_title_layout: QHBoxLayout = QHBoxLayout(self.title_bar)
         hbox_title_layout.setContentsMargins(0, 0, 0, 0)
 
         self.icon_label: QLabel = QLabel()
-        self.icon_label.setPixmap(QIcon(":/Octopus.ico").pixmap(24, 24))
+        self.icon_label.setPixmap(_get_title_pixmap())
         hbox_title_layout.addWidget(self.icon_label)
 
         self.title_label: QLabel = QLabel(f"Music Organizer v{self.version}")
-        self.title_label.setStyleSheet("color: white;")
+        self.title_label.setObjectName("TitleLabel")
         hbox_title_layout.addWidget(self.title_label)
 
         hbox_title_layout.addStretch()
@@ -118,30 +187,21 @@ class MusicOrganizer(QWidget):
         self.settings_button: QPushButton = QPushButton("⚙")
         self.settings_button.setToolTip("Settings")
         self.settings_button.setFixedSize(24, 24)
-        self.settings_button.setStyleSheet(
-            "QPushButton { color: white; background-color: transparent; }"
-            "QPushButton:hover { background-color: blue; }"
-        )
+        self.settings_button.setObjectName("SettingsBtn")
         hbox_title_layout.addWidget(self.settings_button)
         self.settings_button.clicked.connect(self.settings_window)
 
         self.minimize_button: QPushButton = QPushButton("—")
         self.minimize_button.setToolTip("Minimize window")
         self.minimize_button.setFixedSize(24, 24)
-        self.minimize_button.setStyleSheet(
-            "QPushButton { color: white; background-color: transparent; }"
-            "QPushButton:hover { background-color: green; }"
-        )
+        self.minimize_button.setObjectName("MinBtn")
         hbox_title_layout.addWidget(self.minimize_button)
         self.minimize_button.clicked.connect(self.showMinimized)
 
         self.close_button: QPushButton = QPushButton("✕")
         self.close_button.setToolTip("Close window")
         self.close_button.setFixedSize(24, 24)
-        self.close_button.setStyleSheet(
-            "QPushButton { color: white; background-color: transparent; }"
-            "QPushButton:hover { background-color: red; }"
-        )
+        self.close_button.setObjectName("CloseBtn")
         hbox_title_layout.addWidget(self.close_button)
         self.close_button.clicked.connect(self.close)
 
@@ -163,9 +223,18 @@ class MusicOrganizer(QWidget):
 
         This method moves the window when dragging.
         """
-        if hasattr(self, "draggable") and self.draggable:
-            if event.buttons() & Qt.MouseButton.LeftButton:
-                self.move(event.globalPos() - self.offset)
+        if not self.draggable:
+            return
+        if event.buttons() & Qt.MouseButton.LeftButton:
+            self._pending_drag_pos = event.globalPos() - self.offset
+            if not self._drag_timer.isActive():
+                self._drag_timer.start()
+
+    def _apply_drag(self) -> None:
+        """Move the window to the latest drag position."""
+        if self._pending_drag_pos is not None:
+            self.move(self._pending_drag_pos)
+            self._pending_drag_pos = None
 
     def mouseReleaseEvent(self, event: Any) -> None:
         """
@@ -188,7 +257,7 @@ class MusicOrganizer(QWidget):
         """
         # Window setup
         self.setWindowTitle(f"Music Organizer v{self.version}")
-        self.setWindowIcon(QIcon(":/Octopus.ico"))
+        self.setWindowIcon(_get_icon())
         self.setGeometry(100, 100, 400, 260)  # Set initial size of window (x, y, width, height)
 
         # Main layout
@@ -231,11 +300,7 @@ class MusicOrganizer(QWidget):
 
         # Create organize button
         self.organize_button: QPushButton = QPushButton("Organize")
-        # Check if settings are empty
-        if not self.music_folder_path or not self.destination_folder_path:
-            self.organize_button.setEnabled(False)
-        else:
-            self.organize_button.setEnabled(True)
+        self._refresh_organize_enabled()
         vbox_main_layout.addWidget(self.organize_button)
         self.organize_button.clicked.connect(self.organize_function)
 
@@ -260,6 +325,15 @@ class MusicOrganizer(QWidget):
             self.bottom_right_grip, 0, Qt.AlignmentFlag.AlignBottom | Qt.AlignmentFlag.AlignRight
         )
 
+        # Controls locked while organizing or while a secondary window is open
+        self._toggleable_ui: Tuple[QWidget, ...] = (
+            self.destination_folder_select_button,
+            self.music_folder_select_button,
+            self.organize_button,
+            self.close_button,
+            self.settings_button,
+        )
+
     def center_window(self) -> None:
         """Center the window on the screen."""
         PlatformUI.center_window(self)
@@ -277,11 +351,7 @@ class MusicOrganizer(QWidget):
         if music_folder_path:
             self.music_folder_path = music_folder_path
             self.music_folder_label.setText(self.music_folder_path)
-            # Check if settings are empty
-            if not self.music_folder_path or not self.destination_folder_path:
-                self.organize_button.setEnabled(False)
-            else:
-                self.organize_button.setEnabled(True)
+            self._refresh_organize_enabled()
             self.reset_progress_songs_label()
 
     def select_destination_folder(self) -> None:
@@ -299,17 +369,26 @@ class MusicOrganizer(QWidget):
         if destination_folder_path:
             self.destination_folder_path = destination_folder_path
             self.destination_folder_label.setText(self.destination_folder_path)
-            # Check if settings are empty
-            if not self.music_folder_path or not self.destination_folder_path:
-                self.organize_button.setEnabled(False)
-            else:
-                self.organize_button.setEnabled(True)
+            self._refresh_organize_enabled()
             self.reset_progress_songs_label()
 
+    def _refresh_organize_enabled(self) -> None:
+        """Enable the organize button only when both folders are set."""
+        self.organize_button.setEnabled(
+            bool(self.music_folder_path and self.destination_folder_path)
+        )
+
     def reset_progress_songs_label(self) -> None:
         """Reset the progress bar and songs label to their initial state."""
-        self.music_progress_bar.setValue(0)  # Reset the progress bar to 0
-        self.music_progress_bar.setStyleSheet("")  # Reset the style sheet to default
+        # Drop any throttled update so it can't overwrite the reset
+        self._progress_timer.stop()
+        self._progress_pending = None
+        # Skip Qt calls for state that is already reset
+        if self.music_progress_bar.value():
+            self.music_progress_bar.setValue(0)  # Reset the progress bar to 0
+        if self._progress_style_full:
+            self.music_progress_bar.setStyleSheet(self._PROGRESS_EMPTY_QSS)  # Default style
+            self._progress_style_full = False
         self.number_songs_label.setText("")  # Reset number of songs label
 
     def load_settings(self) -> None:
@@ -321,24 +400,21 @@ class MusicOrganizer(QWidget):
         2. Updates the UI with saved paths
         3. Updates the organize button state
         """
-        try:
-            with open("settings_jmo.json", "r") as f:
-                settings_data: Dict[str, Any] = json.load(f)
-                self.music_folder_path = settings_data.get("music_folder_path", "")
-                self.destination_folder_path = settings_data.get("destination_folder_path", "")
-                self.settings.update(settings_data)
-
-                # Update the labels with the loaded values
-                self.music_folder_label.setText(self.music_folder_path)
-                self.destination_folder_label.setText(self.destination_folder_path)
-
-                # Check if settings are empty
-                if not self.music_folder_path or not self.destination_folder_path:
-                    self.organize_button.setEnabled(False)
-                else:
-                    self.organize_button.setEnabled(True)
-        except FileNotFoundError:
+        # Only re-parsed when the file's mtime or size changed since the last read
+        settings_data: Dict[str, Any] = get_settings()
+        if not settings_data:
             logger.warning("Settings file not found")
+            return
+
+        self.music_folder_path = settings_data.get("music_folder_path", "")
+        self.destination_folder_path = settings_data.get("destination_folder_path", "")
+        self.settings.update(settings_data)
+
+        # Update the labels with the loaded values
+        self.music_folder_label.setText(self.music_folder_path)
+        self.destination_folder_label.setText(self.destination_folder_path)
+
+        self._refresh_organize_enabled()
 
     def organize_function(self) -> None:
         """
@@ -356,13 +432,20 @@ class MusicOrganizer(QWidget):
             "selected_music_folder_path": self.music_folder_path,
             "selected_destination_folder_path": self.destination_folder_path,
         }
-        self.organize_thread = OrganizeThread(info)
-        self.organize_thread.number_songs_signal.connect(self.number_songs)
-        self.organize_thread.music_progress_signal.connect(self.music_progress)
-        self.organize_thread.kill_thread_signal.connect(self.kill_thread)
-        self.organize_thread.custom_dialog_signal.connect(self.custom_dialog_function)
-        self.organize_thread.organize_finish_signal.connect(self.organize_finish)
-        self.organize_thread.start()
+        self.organize_thread = thread = OrganizeThread(info)
+        # Every slot touches widgets, so delivery is always queued to the GUI thread;
+        # PyQt5-stubs only declare connect(slot), hence the call-arg ignores
+        queued = Qt.ConnectionType.QueuedConnection
+        thread.number_songs_signal.connect(self.number_songs, queued)  # type: ignore[call-arg]
+        thread.music_progress_signal.connect(self.music_progress, queued)  # type: ignore[call-arg]
+        thread.kill_thread_signal.connect(self.kill_thread, queued)  # type: ignore[call-arg]
+        thread.custom_dialog_signal.connect(
+            self.custom_dialog_function, queued  # type: ignore[call-arg]
+        )
+        thread.organize_finish_signal.connect(
+            self.organize_finish, queued  # type: ignore[call-arg]
+        )
+        thread.start()
 
     def user_interface(self, msg: bool) -> None:
         """
@@ -371,19 +454,9 @@ class MusicOrganizer(QWidget):
         Args:
             msg: True to enable UI elements, False to disable them
         """
-        # Define a list of UI elements to enable/disable
-        ui_elements: List[QWidget] = [
-            self.destination_folder_select_button,
-            self.music_folder_select_button,
-            self.organize_button,
-            self.close_button,
-            self.settings_button,
-        ]
-
         # Set the enabled state of each element based on the value of msg
-        enabled = msg
-        for element in ui_elements:
-            element.setEnabled(enabled)
+        for element in self._toggleable_ui:
+            element.setEnabled(msg)
 
     def number_songs(self, msg: int) -> None:
         """
@@ -404,28 +477,32 @@ class MusicOrganizer(QWidget):
         Args:
             msg: Current progress percentage
         """
-        self.music_progress_bar.setValue(int(msg))
-        if self.music_progress_bar.value() == self.music_progress_bar.maximum():
-            # Update the style sheet for the progress bar
+        if self._progress_timer.isActive():
+            # Within the throttle interval: keep only the latest value
+            self._progress_pending = int(msg)
+            return
+        self._apply_progress(int(msg))
+        self._progress_timer.start()
+
+    def _flush_progress(self) -> None:
+        """Apply the latest progress value held back during the throttle interval."""
+        value = self._progress_pending
+        if value is None:
+            return
+        self._progress_pending = None
+        self._apply_progress(value)
+        self._progress_timer.start()
+
+    def _apply_progress(self, value: int) -> None:
+        """Show a progress value and highlight the bar once it is complete."""
+        self.music_progress_bar.setValue(value)
+        # Style sheets are only reassigned when the complete/incomplete state flips
+        is_full = self.music_progress_bar.value() == self.music_progress_bar.maximum()
+        if is_full != self._progress_style_full:
+            self._progress_style_full = is_full
             self.music_progress_bar.setStyleSheet(
-                """
-                QProgressBar {
-                    border: 1px solid black;
-                    text-align: center;
-                    color: black;
-                    background-color: rgba(255, 152, 152, 1);
-                }
-
-                QProgressBar::chunk {
-                    background-color: rgba(255, 152, 152, 1);
-                }
-            """
+                self._PROGRESS_FULL_QSS if is_full else self._PROGRESS_EMPTY_QSS
             )
-        else:
-            # Check if the current style sheet is different from an empty string
-            if self.music_progress_bar.styleSheet() != "":
-                # Reset the style sheet to default
-                self.music_progress_bar.setStyleSheet("")
 
     def kill_thread(self, msg: str) -> None:
         """
@@ -434,14 +511,15 @@ class MusicOrganizer(QWidget):
         Args:
             msg: Type of thread to kill ('organize' or 'notification')
         """
-        if msg == "organize" and hasattr(self, "organize_thread"):
-            # Delete OrganizeThread if it exists
-            del self.organize_thread
+        if msg == "organize" and self.organize_thread is not None:
+            # The signal can arrive before run() returns; let it finish, then drop the only reference
+            self.organize_thread.wait()
+            self.organize_thread = None
             # Re-enable UI elements
             self.user_interface(True)
-        if msg == "notification" and hasattr(self, "notification_thread"):
-            # Delete NotificationAudioThread if it exists
-            del self.notification_thread
+        if msg == "notification" and self.notification_thread is not None:
+            # NotificationAudioThread is shared and reused, so only drop the reference
+            self.notification_thread = None
 
     def custom_dialog_function(self, msg: str) -> None:
         """
@@ -474,6 +552,9 @@ class MusicOrganizer(QWidget):
     def organize_replace_skip(self) -> None:
         """Show the replace/skip window for files that already exist."""
         if self.recall_files["replace_skip_files"]:
+            # Imported on first use; the window is only reachable after organizing
+            from .replace_skip_window import ReplaceSkipWindow
+
             # Music File Replace Skip Window
             self.music_replace_skip_window = ReplaceSkipWindow(
                 self.recall_files["replace_skip_files"]
@@ -506,6 +587,8 @@ class MusicOrganizer(QWidget):
                 logger.warning("No error files to display")
                 return
 
+            from .music_error_window import MusicErrorWindow  # Imported on first use
+
             error_window = self.window_manager.create_window(
                 MusicErrorWindow, "error_window", self.recall_files["error_files"]
             )
@@ -522,6 +605,8 @@ class MusicOrganizer(QWidget):
     def settings_window(self) -> None:
         """Show the settings window."""
         try:
+            from .settings_window import SettingsWindow  # Imported on first use
+
             settings_data = self.get_current_settings()
             settings_window = self.window_manager.create_window(
                 SettingsWindow, "settings_window", settings_data
@@ -548,7 +633,7 @@ class MusicOrganizer(QWidget):
     def _setup_platform_specific(self) -> None:
         """Configure platform-specific window behavior."""
         try:
-            system = platform.system()
+            system = _SYSTEM
             if system == "Windows":
                 flags: WindowFlags = QtConstants.Window | QtConstants.FramelessWindowHint
                 self.setWindowFlags(flags)
@@ -568,8 +653,8 @@ class MusicOrganizer(QWidget):
             self.setWindowFlags(QtConstants.Window)  # Fallback
 
         # Apply platform-specific font settings
-        font_settings = PlatformUI.get_font_settings()
-        self.setFont(QFont(font_settings["family"], font_settings["size"]))
+        font_settings = self._FONT_SETTINGS
+        self.setFont(_get_font(font_settings["family"], font_settings["size"]))
 
     def get_current_settings(self) -> Dict[str, Any]:
         """Get current settings for the settings window.
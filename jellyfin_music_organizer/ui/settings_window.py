@@ -1,4 +1,3 @@
-import json
 import os
 import platform
 from logging import getLogger
@@ -17,7 +16,9 @@ from PyQt5.QtWidgets import (
     QWidget,
 )
 
-from ..utils.config import ConfigManager
+from ..utils import json_compat
+from ..utils.config import ConfigManager, get_settings
+from ..utils.constants import Paths
 from ..utils.dialogs import DialogManager
 from ..utils.qt_types import QtConstants, WindowFlags
 
@@ -278,13 +279,11 @@ class SettingsWindow(QWidget):
     def load_settings(self) -> None:
         """Load settings from file and update UI."""
         try:
-            if not Path("settings_jmo.json").exists():
+            settings = get_settings()
+            if not settings:
                 logger.debug("No settings file found")
                 return
 
-            with open("settings_jmo.json", "r", encoding="utf-8") as f:
-                settings = json.load(f)
-
             # Update UI with loaded settings
             self.music_folder_path = settings.get("music_folder_path", "")
             self.destination_folder_path = settings.get("destination_folder_path", "")
@@ -293,7 +292,7 @@ class SettingsWindow(QWidget):
             self.sound_checkbox.setChecked(settings.get("mute_sound", False))
             self.illegal_chars_checkbox.setChecked(settings.get("remove_illegal_chars", True))
 
-        except json.JSONDecodeError as e:
+        except json_compat.JSONDecodeError as e:
             logger.error(f"Invalid settings file format: {e}")
         except Exception as e:
             logger.error(f"Failed to load settings: {e}")
@@ -309,8 +308,7 @@ class SettingsWindow(QWidget):
                 "version": self.version,
             }
 
-            with open("settings_jmo.json", "w", encoding="utf-8") as f:
-                json.dump(settings, f, indent=4)
+            Paths.CONFIG_FILE.write_bytes(json_compat.dumps(settings))
 
             logger.debug("Settings saved successfully")
         except Exception as e:
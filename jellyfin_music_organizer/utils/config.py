@@ -2,15 +2,41 @@
 Configuration management for the Jellyfin Music Organizer application.
 """
 
+import copy
 import json
 import logging
+import os
 import platform
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Optional, Tuple, Union
 
+from . import json_compat
+from .constants import Paths
 from .platform_utils import PlatformPaths
 
 
+@lru_cache(maxsize=1)
+def _load_settings_cached(mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse the settings file; the stat arguments only key the cache."""
+    return json_compat.loads(Paths.CONFIG_FILE.read_bytes())
+
+
+def get_settings() -> Dict[str, Any]:
+    """
+    Get the contents of the settings file, parsing it only after it changes.
+
+    Returns:
+        Deep copy of the saved settings, or an empty dict if the file doesn't exist
+    """
+    try:
+        stat = os.stat(Paths.CONFIG_FILE)
+    except FileNotFoundError:
+        return {}
+    # Deep copy so callers mutating nested values (e.g. window_state) can't alter the cache
+    return copy.deepcopy(_load_settings_cached(stat.st_mtime_ns, stat.st_size))
+
+
 class ConfigManager:
     """
     Manages application configuration.
@@ -34,6 +60,8 @@ class ConfigManager:
         self.logger = logging.getLogger(__name__)
         self.settings: Dict[str, Any] = self.DEFAULT_CONFIG.copy()
         self.config_path = Path(config_path) if config_path else self._get_default_config_path()
+        # (st_mtime_ns, st_size) of the file as last read or written; load() skips an unchanged file
+        self._loaded_stat: Optional[Tuple[int, int]] = None
 
     def _get_platform_defaults(self) -> Dict[str, Any]:
         """Get platform-specific default settings."""
@@ -60,19 +88,33 @@ class ConfigManager:
             self.logger.error(f"Config validation failed: {e}")
             return False
 
+    def _stat_key(self) -> Optional[Tuple[int, int]]:
+        """Get the modification time and size of the configuration file, or None if missing."""
+        try:
+            stat = os.stat(self.config_path)
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
     def load(self) -> Dict[str, Any]:
-        """Load configuration from file."""
+        """Load configuration from file, reading it again only after it changes."""
         try:
-            if self.config_path.exists():
+            stat_key = self._stat_key()
+            if stat_key is not None and stat_key != self._loaded_stat:
                 with open(self.config_path, "r") as f:
                     loaded_settings = json.load(f)
                     if self.validate_config(loaded_settings):
                         self.settings.update(loaded_settings)
+            self._loaded_stat = stat_key
             return self.settings
         except Exception as e:
             self.logger.error(f"Failed to load config: {e}")
             return self.settings
 
+    def invalidate(self) -> None:
+        """Make the next load() read the configuration file again."""
+        self._loaded_stat = None
+
     def save(self, settings: Optional[Dict[str, Any]] = None) -> None:
         """Save configuration to file."""
         try:
@@ -82,6 +124,8 @@ class ConfigManager:
             self.config_path.parent.mkdir(parents=True, exist_ok=True)
             with open(self.config_path, "w") as f:
                 json.dump(self.settings, f, indent=4)
+            # The file now holds self.settings, so the next load() has nothing new to read
+            self._loaded_stat = self._stat_key()
         except Exception as e:
             self.logger.error(f"Failed to save config: {e}")
 
@@ -4,6 +4,7 @@ File operations utility functions for the Jellyfin Music Organizer application.
 
 import os
 import shutil
+import sys
 from functools import wraps
 from logging import getLogger
 from pathlib import Path
@@ -12,10 +13,58 @@ from typing import Any, Callable, List, Optional, TypeVar
 from .constants import SUPPORTED_AUDIO_EXTENSIONS
 from .exceptions import FileOperationError
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None  # type: ignore[assignment]
+
 logger = getLogger(__name__)
 
 T = TypeVar("T")  # For generic return type
 
+# Linux ioctl that shares the source extents with the destination (reflink) on CoW filesystems
+_FICLONE = 0x40049409
+
+
+def _kernel_copy(source: Path, destination: Path) -> bool:
+    """Copy file contents without passing them through user space.
+
+    Tries a reflink clone first, then os.copy_file_range. Only Linux is
+    handled here; other platforms already get their native fast path from shutil.
+
+    Args:
+        source: Source file path
+        destination: Destination file path
+
+    Returns:
+        True if the data was copied, False if the caller should fall back to shutil
+    """
+    if fcntl is None or not sys.platform.startswith("linux"):
+        return False
+
+    with open(source, "rb") as fsrc, open(destination, "wb") as fdst:
+        src_fd, dst_fd = fsrc.fileno(), fdst.fileno()
+        try:
+            fcntl.ioctl(dst_fd, _FICLONE, src_fd)
+            return True
+        except OSError:
+            pass  # Not a CoW filesystem or different filesystems
+
+        copy_file_range = getattr(os, "copy_file_range", None)
+        if copy_file_range is None:  # Python < 3.8
+            return False
+        remaining = os.fstat(src_fd).st_size
+        try:
+            while remaining > 0:
+                copied = copy_file_range(src_fd, dst_fd, remaining)
+                if not copied:
+                    break
+                remaining -= copied
+        except OSError:
+            # shutil reopens the destination for writing, discarding any partial copy
+            return False
+        return remaining <= 0
+
 
 def with_error_handling(func: Callable[..., T]) -> Callable[..., T]:
     """Decorator for handling file operation errors.
@@ -52,10 +101,12 @@ def get_music_files(directory: str) -> List[Path]:
         FileOperationError: If directory doesn't exist or is not accessible
     """
     try:
-        pathlist: List[Path] = []
-        for extension in SUPPORTED_AUDIO_EXTENSIONS:
-            pathlist.extend(list(Path(directory).glob(f"**/*{extension}")))
-        return pathlist
+        # Single traversal filtered by suffix instead of one glob per extension
+        return [
+            path
+            for path in Path(directory).rglob("*")
+            if path.suffix.lower() in SUPPORTED_AUDIO_EXTENSIONS and path.is_file()
+        ]
     except Exception as e:
         raise FileOperationError(f"Error scanning directory: {e}")
 
@@ -235,7 +286,11 @@ class FileOperations:
     @staticmethod
     @with_error_handling
     def safe_copy(
-        source: Path, destination: Path, overwrite: bool = False, preserve_metadata: bool = True
+        source: Path,
+        destination: Path,
+        overwrite: bool = False,
+        preserve_metadata: bool = True,
+        create_parent: bool = True,
     ) -> bool:
         """Safely copy a file with metadata preservation.
 
@@ -244,6 +299,8 @@ class FileOperations:
             destination: Destination file path
             overwrite: Whether to overwrite existing files
             preserve_metadata: Whether to preserve file metadata
+            create_parent: Whether to create the destination directory; callers that
+                already track created directories can skip the extra mkdir
 
         Returns:
             True if copy was successful
@@ -261,7 +318,8 @@ class FileOperations:
             raise FileExistsError(f"Destination file exists: {destination}")
 
         # Ensure destination directory exists
-        destination.parent.mkdir(parents=True, exist_ok=True)
+        if create_parent:
+            destination.parent.mkdir(parents=True, exist_ok=True)
 
         # Ensure both paths are writable
         if not FileOperations.ensure_writable(source):
@@ -269,8 +327,13 @@ class FileOperations:
         if not FileOperations.ensure_writable(destination):
             raise PermissionError(f"Destination path not writable: {destination}")
 
-        # Copy with metadata preservation if requested
-        if preserve_metadata:
+        # Copy in the kernel where possible, then apply the same metadata shutil would
+        if _kernel_copy(source, destination):
+            if preserve_metadata:
+                shutil.copystat(source, destination)
+            else:
+                shutil.copymode(source, destination)
+        elif preserve_metadata:
             shutil.copy2(source, destination)
         else:
             shutil.copy(source, destination)
@@ -0,0 +1,45 @@
+"""JSON compatibility layer that prefers orjson when it is installed."""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:  # pragma: no cover - optional dependency
+    HAS_ORJSON = False
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so one alias covers both parsers
+JSONDecodeError = json.JSONDecodeError
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Deserialize a JSON document.
+
+    Args:
+        data: Raw JSON bytes or text
+
+    Returns:
+        Deserialized Python object
+    """
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, pretty: bool = True) -> bytes:
+    """Serialize an object to UTF-8 encoded JSON.
+
+    Args:
+        obj: Object to serialize
+        pretty: Whether to indent the output; compact output has no whitespace at all
+
+    Returns:
+        Encoded JSON bytes
+    """
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+    if pretty:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
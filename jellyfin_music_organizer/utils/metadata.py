@@ -2,11 +2,22 @@
 Metadata operations utility functions for the Jellyfin Music Organizer application.
 """
 
+import os
 from logging import getLogger
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Type, Union
 
 import mutagen
-from mutagen.asf import ASFUnicodeAttribute
+from mutagen.aiff import AIFF
+from mutagen.asf import ASF, ASFUnicodeAttribute
+from mutagen.flac import FLAC
+from mutagen.id3 import ID3, TALB, TPE1, ID3NoHeaderError
+from mutagen.monkeysaudio import MonkeysAudio
+from mutagen.mp3 import MP3
+from mutagen.mp4 import MP4
+from mutagen.musepack import Musepack
+from mutagen.oggopus import OggOpus
+from mutagen.oggvorbis import OggVorbis
+from mutagen.wave import WAVE
 
 from .constants import MetadataTags
 from .exceptions import MetadataError
@@ -15,6 +26,72 @@ from .typing_compat import MetadataValue
 
 logger = getLogger(__name__)
 
+# Parser for each supported extension, so mutagen doesn't have to sniff every file's header
+_PARSERS: Dict[str, Type[mutagen.FileType]] = {
+    ".aif": AIFF,
+    ".aiff": AIFF,
+    ".ape": MonkeysAudio,
+    ".flac": FLAC,
+    ".m4a": MP4,
+    ".m4b": MP4,
+    ".m4r": MP4,
+    ".mp2": MP3,
+    ".mp3": MP3,
+    ".mp4": MP4,
+    ".mpc": Musepack,
+    ".ogg": OggVorbis,
+    ".opus": OggOpus,
+    ".wav": WAVE,
+    ".wma": ASF,
+}
+
+
+# Only these ID3 frames are decoded; the rest (e.g. embedded artwork) stay as raw bytes
+_ID3_NAME_FRAMES = {"TPE1": TPE1, "TALB": TALB}
+
+# Lowercase names of the artist and album tags returned by extract_metadata
+_NAME_TAGS = frozenset(MetadataTags.get_tags("artist") + MetadataTags.get_tags("album"))
+
+
+def _select_name_tags(tags: Optional[Union[Mapping[str, Any], ID3]]) -> Dict[str, MetadataValue]:
+    """
+    Keep the artist and album entries of a file's tags.
+
+    Both the MP3 fast path and the full parse go through this, so callers get the
+    same keys whichever parser read the file.
+
+    Args:
+        tags: Tag mapping of a parsed file (an ID3 tag for MP3s), or None if it has no tags
+
+    Returns:
+        Artist and album values keyed as the file names them (e.g. TPE1, ©ART, artist)
+    """
+    if tags is None:
+        return {}
+    return {key: tags[key] for key in tags.keys() if key.lower() in _NAME_TAGS}
+
+
+def open_audio(file_path: str) -> Optional[mutagen.FileType]:
+    """
+    Open a music file with the parser matching its extension.
+
+    This is the single entry point used to parse audio files, so every metadata
+    reader (including the scan that produces the error window's entries) shares it.
+
+    Args:
+        file_path: Path to the music file
+
+    Returns:
+        Parsed file, or None if mutagen doesn't recognise the format
+    """
+    parser = _PARSERS.get(os.path.splitext(file_path)[1].lower())
+    if parser is not None:
+        try:
+            return parser(file_path)
+        except mutagen.MutagenError:
+            pass  # Content doesn't match the extension, e.g. Opus in a .ogg file
+    return mutagen.File(file_path)
+
 
 def extract_metadata(file_path: str) -> Dict[str, MetadataValue]:
     """
@@ -30,11 +107,20 @@ def extract_metadata(file_path: str) -> Dict[str, MetadataValue]:
         MetadataError: If metadata extraction fails
     """
     try:
-        metadata = mutagen.File(file_path)
+        if file_path.lower().endswith(".mp3"):
+            try:
+                # An MP3's tags are its ID3 tag, so this parse is final whatever it holds
+                id3 = ID3(file_path, known_frames=_ID3_NAME_FRAMES, translate=False)
+            except ID3NoHeaderError:
+                pass  # No ID3 tag to read; let the full parser identify the file
+            else:
+                return _select_name_tags(id3)
+
+        metadata = open_audio(file_path)
         if metadata is None:
             raise MetadataError("Could not read file metadata")
 
-        return {tag: metadata.get(tag, "") for tag in MetadataTags.get_tags("all")}
+        return _select_name_tags(metadata.tags)
     except Exception as e:
         raise MetadataError(f"Failed to extract metadata: {e}")
 
@@ -1,13 +1,14 @@
 import qdarkstyle
 from PyQt5.QtWidgets import QApplication
 
-# Import the main window class
-from jellyfin_music_organizer.main import MusicOrganizer
-
 # Create and run application
 if __name__ == "__main__":
     app = QApplication([])
     app.setStyleSheet(qdarkstyle.load_stylesheet_pyqt5())
+
+    # Import the main window class once the application exists
+    from jellyfin_music_organizer.ui.music_organizer import MusicOrganizer
+
     window = MusicOrganizer()
     window.show()  # Make sure to show the window
     app.exec_()
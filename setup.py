@@ -11,6 +11,9 @@ setup(
         "pathlib>=1.0.1",
         "openpyxl>=3.0.0",
     ],
+    extras_require={
+        "speedups": ["orjson>=3.6"],
+    },
     entry_points={
         "console_scripts": [
             "jellyfin-music-organizer=jellyfin_music_organizer.main:main",
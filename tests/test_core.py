@@ -0,0 +1,546 @@
+"""Unit tests for the Jellyfin Music Organizer core modules.
+
+This module covers:
+- Loading and saving of the core configuration manager
+- Source tree scanning and progress reporting in OrganizeThread
+- Sound effect caching and completion reporting of the notification player
+"""
+
+import os
+import queue
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from unittest.mock import patch
+
+from mutagen.id3 import ID3, TALB, TPE1
+from PyQt5.QtCore import QUrl
+from PyQt5.QtMultimedia import QSoundEffect
+
+from jellyfin_music_organizer.core import config as core_config
+from jellyfin_music_organizer.core import notification_audio_thread, organize_thread
+from jellyfin_music_organizer.core.config import ConfigManager
+from jellyfin_music_organizer.core.notification_audio_thread import NotificationAudioThread
+from jellyfin_music_organizer.core.organize_thread import OrganizeThread
+from jellyfin_music_organizer.utils import json_compat
+
+
+class TestCoreConfigManager(unittest.TestCase):
+    """Test cases for the core ConfigManager."""
+
+    def setUp(self) -> None:
+        """Set up test environment."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.config_path = self.temp_dir / "config.json"
+        self.config = ConfigManager(self.config_path)
+
+    def tearDown(self) -> None:
+        """Clean up test environment."""
+        self.config.flush()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _saved(self) -> ConfigManager:
+        """Load the configuration file through a fresh manager."""
+        reader = ConfigManager(self.config_path)
+        reader.load()
+        return reader
+
+    def test_round_trip_without_orjson(self) -> None:
+        """Test that the stdlib fallback reads and writes the same configuration."""
+        self.config.set("music_folder_path", "/música/Ærø")
+        self.config.flush()
+        with patch.object(json_compat, "HAS_ORJSON", False):
+            reader = self._saved()
+            reader.set("mute_sound", True)
+            reader.flush()
+
+        saved = self._saved()
+        self.assertEqual(saved.get("music_folder_path"), "/música/Ærø")
+        self.assertTrue(saved.get("mute_sound"))
+
+    def test_load_drops_unknown_keys(self) -> None:
+        """Test that keys from other versions are ignored instead of failing the load."""
+        self.config_path.write_text('{"mute_sound": true, "theme": "dark"}')
+        saved = self._saved()
+
+        self.assertTrue(saved.get("mute_sound"))
+        self.assertIsNone(saved.get("theme"))
+
+    def test_load_rejects_non_object(self) -> None:
+        """Test that a document that isn't a JSON object keeps the defaults."""
+        self.config_path.write_text('["mute_sound", true]')
+        with self.assertLogs(core_config.logger, "WARNING"):
+            saved = self._saved()
+
+        self.assertFalse(saved.get("mute_sound"))
+
+    def test_malformed_file_is_logged(self) -> None:
+        """Test that a config file that isn't valid JSON is reported as a warning."""
+        self.config_path.write_text('{"mute_sound": tru')
+        with patch("builtins.print") as mock_print:
+            with self.assertLogs(core_config.logger, "WARNING") as logs:
+                saved = self._saved()
+            mock_print.assert_not_called()
+
+        self.assertIn("Error loading config", logs.output[0])
+        self.assertFalse(saved.get("mute_sound"))
+
+    def test_saved_json_is_compact(self) -> None:
+        """Test that the config file has no indentation unless debug logging is on."""
+        self.config.set("mute_sound", True)
+        self.config.flush()
+        self.assertNotIn(b" ", self.config_path.read_bytes())
+
+        with patch.object(core_config.logger, "isEnabledFor", return_value=True):
+            self.config.set("mute_sound", False)
+            self.config.flush()
+        self.assertIn(b'\n  "mute_sound": false', self.config_path.read_bytes())
+
+    def test_failed_replace_keeps_previous_file(self) -> None:
+        """Test that a failed save leaves the old file in place and no temp file behind."""
+        self.config.set("mute_sound", True)
+        self.config.flush()
+
+        self.config.set("mute_sound", False)
+        with patch.object(core_config.os, "replace", side_effect=OSError("disk full")):
+            with self.assertRaises(OSError):
+                self.config.flush()
+
+        self.assertEqual(os.listdir(self.temp_dir), ["config.json"])
+        self.assertTrue(self._saved().get("mute_sound"))
+
+    def test_default_path_is_resolved_once(self) -> None:
+        """Test that managers without an explicit path share one home lookup."""
+        core_config._default_config_path.cache_clear()
+        self.addCleanup(core_config._default_config_path.cache_clear)
+        with patch.object(core_config.Path, "home", return_value=self.temp_dir) as mock_home:
+            first = ConfigManager()
+            second = ConfigManager()
+            mock_home.assert_called_once()
+
+        expected = self.temp_dir / ".jellyfin_music_organizer" / "config.json"
+        self.assertEqual(first.config_path, expected)
+        self.assertEqual(second.config_path, expected)
+
+    @unittest.skipIf(sys.version_info < (3, 10), "slotted dataclasses need Python 3.10+")
+    def test_app_config_is_slotted(self) -> None:
+        """Test that AppConfig stores its fields in slots."""
+        config = core_config.AppConfig()
+        self.assertFalse(hasattr(config, "__dict__"))
+        with self.assertRaises(AttributeError):
+            config.theme = "dark"  # type: ignore[attr-defined]
+
+    def test_unknown_key_is_ignored(self) -> None:
+        """Test that get() and set() ignore names that aren't configuration fields."""
+        with patch.object(self.config, "_schedule_save") as mock_schedule:
+            self.config.set("logger", "value")
+            self.config.set("save", "value")
+            mock_schedule.assert_not_called()
+
+        self.assertIsNone(self.config.get("logger"))
+        self.assertIsNone(self.config.get("__class__"))
+        self.assertEqual(self.config.get("version"), "3.06")
+
+    def test_in_place_edit_is_saved(self) -> None:
+        """Test that a dict field mutated in place and set again is persisted."""
+        window_state = self.config.get("window_state")
+        window_state["main"] = {"x": 10}
+        self.config.set("window_state", window_state)
+        self.config.flush()
+
+        self.assertEqual(self._saved().get("window_state"), {"main": {"x": 10}})
+
+    def test_unchanged_value_is_not_saved(self) -> None:
+        """Test that setting an equal immutable value schedules no save."""
+        with patch.object(self.config, "_schedule_save") as mock_schedule:
+            self.config.set("mute_sound", False)
+            mock_schedule.assert_not_called()
+
+    def test_rapid_changes_are_saved_once(self) -> None:
+        """Test that a burst of set() calls is coalesced into a single deferred write."""
+        with patch.object(self.config, "save", wraps=self.config.save) as mock_save:
+            self.config.set("music_folder_path", "/music")
+            self.config.set("destination_folder_path", "/organized")
+            self.config.set("mute_sound", True)
+            mock_save.assert_not_called()
+
+            self.config.flush()
+            self.config.flush()
+            mock_save.assert_called_once()
+
+        self.assertEqual(self._saved().get("destination_folder_path"), "/organized")
+
+    def test_pending_save_is_flushed_once_at_exit(self) -> None:
+        """Test that the exit hook writes a deferred save and then releases the manager."""
+        with patch("atexit.register") as mock_register:
+            manager = ConfigManager(self.config_path)
+            mock_register.assert_not_called()
+
+        manager.set("mute_sound", True)
+        self.assertIn(manager, core_config._PENDING_SAVES)
+
+        core_config._flush_pending_saves()
+        self.assertNotIn(manager, core_config._PENDING_SAVES)
+        self.assertTrue(self._saved().get("mute_sound"))
+
+
+class _SlowScanThread(OrganizeThread):
+    """OrganizeThread whose scan ends only after every found file has been processed."""
+
+    def _scan_worker(self, root: str, scan_queue: "queue.Queue[Optional[Path]]") -> None:
+        for path in sorted(Path(root).iterdir()):
+            scan_queue.put(path)
+        time.sleep(0.5)
+        scan_queue.put(None)
+
+
+class TestOrganizeThread(unittest.TestCase):
+    """Test cases for OrganizeThread, run synchronously on the test thread."""
+
+    # Processed metadata of a song with artist and album tags
+    TAGS = {"TPE1": "Artist", "TALB": "Album"}
+
+    def setUp(self) -> None:
+        """Set up test environment."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.music_dir = self.temp_dir / "music"
+        self.dest_dir = self.temp_dir / "organized"
+        self.music_dir.mkdir()
+        self.dest_dir.mkdir()
+
+    def tearDown(self) -> None:
+        """Clean up test environment."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _run(self, music_dir: Path, thread_class: type = OrganizeThread) -> Dict[str, List[Any]]:
+        """Run an organize pass and collect the emitted signal values."""
+        emitted: Dict[str, List[Any]] = {
+            "progress": [],
+            "dialog": [],
+            "finish": [],
+        }
+        thread = thread_class(
+            {
+                "selected_music_folder_path": str(music_dir),
+                "selected_destination_folder_path": str(self.dest_dir),
+            }
+        )
+        thread.music_progress_signal.connect(emitted["progress"].append)
+        thread.custom_dialog_signal.connect(emitted["dialog"].append)
+        thread.organize_finish_signal.connect(emitted["finish"].append)
+        thread.run()
+        return emitted
+
+    def test_final_progress_is_reported(self) -> None:
+        """Test that progress reaches 100 when every file finishes before the scan ends."""
+        for n in range(3):
+            (self.music_dir / f"song{n}.mp3").write_bytes(b"not audio")
+
+        emitted = self._run(self.music_dir, _SlowScanThread)
+
+        self.assertEqual(emitted["progress"][-1], 100)
+        self.assertEqual(len(emitted["finish"]), 1)
+        self.assertEqual(len(emitted["finish"][0]["error_files"]), 3)
+
+    def test_metadata_is_extracted_on_worker_threads(self) -> None:
+        """Test that tags are read off the organizing thread and every file is reported."""
+        for n in range(8):
+            (self.music_dir / f"song{n}.mp3").write_bytes(b"not audio")
+        threads = set()
+        process_metadata = OrganizeThread.process_metadata
+
+        def record_thread(thread: OrganizeThread, path: Path) -> Dict[str, str]:
+            threads.add(threading.current_thread())
+            return process_metadata(thread, path)
+
+        with patch.object(OrganizeThread, "process_metadata", autospec=True) as mock_process:
+            mock_process.side_effect = record_thread
+            emitted = self._run(self.music_dir)
+
+        self.assertNotIn(threading.current_thread(), threads)
+        error_files = emitted["finish"][0]["error_files"]
+        self.assertEqual(
+            sorted(info["file_name"] for info in error_files), [f"song{n}.mp3" for n in range(8)]
+        )
+
+    def test_copies_run_on_writer_thread(self) -> None:
+        """Test that copies leave the organizing thread and queued names count as existing."""
+        for folder in ("a", "b"):
+            (self.music_dir / folder).mkdir()
+            (self.music_dir / folder / "song.mp3").write_bytes(b"")
+        copy_threads = []
+
+        def record_copy(source: Path, metadata: Dict[str, str]) -> None:
+            copy_threads.append(threading.current_thread())
+
+        with patch.object(OrganizeThread, "process_metadata", return_value=self.TAGS):
+            with patch.object(OrganizeThread, "organize_file", side_effect=record_copy):
+                emitted = self._run(self.music_dir)
+
+        self.assertEqual(len(copy_threads), 1)
+        self.assertIsNot(copy_threads[0], threading.current_thread())
+        recall_files = emitted["finish"][0]
+        self.assertEqual(recall_files["error_files"], [])
+        self.assertEqual(len(recall_files["replace_skip_files"]), 1)
+
+    def test_failed_copy_is_reported(self) -> None:
+        """Test that a copy failing on the writer thread is added to the error files."""
+        (self.music_dir / "song.mp3").write_bytes(b"")
+
+        with patch.object(OrganizeThread, "process_metadata", return_value=self.TAGS):
+            with patch.object(OrganizeThread, "organize_file", side_effect=OSError("disk full")):
+                emitted = self._run(self.music_dir)
+
+        error_files = emitted["finish"][0]["error_files"]
+        self.assertEqual(
+            [(info["file_name"], info["error"]) for info in error_files],
+            [("song.mp3", "disk full")],
+        )
+        self.assertEqual(emitted["progress"][-1], 100)
+
+    def test_artist_and_album_keys_match_any_case(self) -> None:
+        """Test that artist and album tags are found whatever the format's key case."""
+        (self.music_dir / "song.m4a").write_bytes(b"")
+        (self.music_dir / "untagged.flac").write_bytes(b"")
+        tags = {
+            "song.m4a": {"©nam": "Title", "©ART": "Artist", "©alb": "Album"},
+            "untagged.flac": {"ARTIST": "Artist", "TITLE": "Title"},
+        }
+
+        with patch.object(OrganizeThread, "process_metadata", side_effect=lambda p: tags[p.name]):
+            with patch.object(OrganizeThread, "organize_file") as mock_organize:
+                emitted = self._run(self.music_dir)
+
+        self.assertEqual([call.args[0].name for call in mock_organize.call_args_list], ["song.m4a"])
+        error_files = emitted["finish"][0]["error_files"]
+        self.assertEqual(
+            [(info["file_name"], info["error"]) for info in error_files],
+            [("untagged.flac", "Artist or album data not found")],
+        )
+
+    def test_progress_is_emitted_only_on_change(self) -> None:
+        """Test that each percentage is sent at most once, however many songs there are."""
+        for n in range(250):
+            (self.music_dir / f"song{n}.mp3").write_bytes(b"")
+
+        emitted = self._run(self.music_dir)
+
+        progress = emitted["progress"]
+        self.assertEqual(progress, sorted(set(progress)))
+        self.assertLessEqual(len(progress), 101)
+        self.assertEqual(progress[-1], 100)
+
+    def test_destination_directory_is_created_once(self) -> None:
+        """Test that organizing several files into one album creates its directory once."""
+        thread = OrganizeThread({"selected_destination_folder_path": str(self.dest_dir)})
+        # An existing parent keeps mkdir from recursing, so each creation is one call
+        (self.dest_dir / "Artist").mkdir()
+        real_mkdir = Path.mkdir
+        with patch.object(Path, "mkdir", autospec=True, side_effect=real_mkdir) as mock_mkdir:
+            for n in range(3):
+                source = self.music_dir / f"song{n}.mp3"
+                source.write_bytes(b"audio")
+                metadata = {"artist": "Artist", "album": "Album", "filename": source.name}
+                thread.organize_file(source, metadata)
+
+        self.assertEqual(mock_mkdir.call_count, 1)
+        album_dir = self.dest_dir / "Artist" / "Album"
+        self.assertEqual(sorted(os.listdir(album_dir)), ["song0.mp3", "song1.mp3", "song2.mp3"])
+
+    def test_unchanged_copy_is_skipped(self) -> None:
+        """Test that a destination file matching the source's size and mtime isn't offered again."""
+        for name in ("same.mp3", "changed.mp3"):
+            (self.music_dir / name).write_bytes(b"audio")
+        album_dir = self.dest_dir / "X" / "Y"
+        album_dir.mkdir(parents=True)
+        shutil.copy2(self.music_dir / "same.mp3", album_dir / "same.mp3")
+        (album_dir / "changed.mp3").write_bytes(b"older audio")
+
+        tags = {"TPE1": "X", "TALB": "Y"}
+        with patch.object(OrganizeThread, "process_metadata", return_value=tags):
+            with patch.object(OrganizeThread, "organize_file") as mock_organize:
+                emitted = self._run(self.music_dir)
+
+        mock_organize.assert_not_called()
+        recall_files = emitted["finish"][0]
+        self.assertEqual(recall_files["error_files"], [])
+        self.assertEqual(
+            [info["file_name"] for info in recall_files["replace_skip_files"]], ["changed.mp3"]
+        )
+
+    def test_missing_source_folder_has_no_songs(self) -> None:
+        """Test that a missing source folder reports that no songs were found."""
+        emitted = self._run(self.temp_dir / "missing")
+
+        self.assertEqual(emitted["dialog"], ["No songs were found in the selected folder."])
+        self.assertEqual(emitted["finish"], [])
+
+    def test_case_insensitive_destination_collision(self) -> None:
+        """Test that a differently cased existing file is found on a case-insensitive volume."""
+        source = self.music_dir / "foo.mp3"
+        source.write_bytes(b"\xff\xfb\x90\x64" + b"\x00" * 413)
+        tags = ID3()
+        tags.add(TPE1(encoding=3, text=["X"]))
+        tags.add(TALB(encoding=3, text=["Y"]))
+        tags.save(source)
+        existing = self.dest_dir / "X" / "Y" / "Foo.mp3"
+        existing.parent.mkdir(parents=True)
+        existing.write_bytes(b"older copy")
+
+        with patch.object(organize_thread, "_is_case_insensitive", return_value=True):
+            emitted = self._run(self.music_dir)
+
+        replace_skip = emitted["finish"][0]["replace_skip_files"]
+        self.assertEqual([info["file_name"] for info in replace_skip], ["foo.mp3"])
+        self.assertEqual(os.listdir(existing.parent), ["Foo.mp3"])
+
+    def test_clean_filename(self) -> None:
+        """Test that illegal characters and ellipses are removed in one pass."""
+        thread = OrganizeThread({})
+        self.assertEqual(thread.clean_filename(' AC/DC: "Live" <1991>? '), "ACDC Live 1991")
+        self.assertEqual(thread.clean_filename("Wait... For It....."), "Wait For It")
+        self.assertEqual(thread.clean_filename("Vol. 2.."), "Vol. 2..")
+
+        thread.remove_illegal_chars = False
+        self.assertEqual(thread.clean_filename(" AC/DC... "), "AC/DC...")
+
+    def test_scan_finds_nested_audio_files(self) -> None:
+        """Test that one walk finds audio files at any depth, whatever the extension case."""
+        nested = self.music_dir / "Artist" / "Album"
+        nested.mkdir(parents=True)
+        for path in (
+            self.music_dir / "top.mp3",
+            nested / "deep.FLAC",
+            nested / "cover.jpg",
+            nested / "notes.txt",
+        ):
+            path.write_bytes(b"")
+
+        found = organize_thread._scandir_recursive(str(self.music_dir))
+
+        self.assertEqual(sorted(path.name for path in found), ["deep.FLAC", "top.mp3"])
+
+    def test_top_level_folders_are_scanned_on_pool(self) -> None:
+        """Test that the pooled scan queues every file and ends with a single sentinel."""
+        expected = ["top.mp3"]
+        (self.music_dir / "top.mp3").write_bytes(b"")
+        for n in range(4):
+            album_dir = self.music_dir / f"artist{n}" / "album"
+            album_dir.mkdir(parents=True)
+            (album_dir / f"song{n}.mp3").write_bytes(b"")
+            expected.append(f"song{n}.mp3")
+
+        scan_queue: "queue.Queue[Optional[Path]]" = queue.Queue()
+        OrganizeThread({})._scan_worker(str(self.music_dir), scan_queue)
+        found = [scan_queue.get_nowait() for _ in range(scan_queue.qsize())]
+
+        self.assertIsNone(found.pop())
+        self.assertEqual(sorted(path.name for path in found), sorted(expected))
+
+    def test_subtree_scan_error_fails_the_run(self) -> None:
+        """Test that an error raised on a pool thread is reported by the organize thread."""
+        (self.music_dir / "artist").mkdir()
+
+        with patch.object(
+            organize_thread, "_scandir_recursive", side_effect=RuntimeError("scan broke")
+        ):
+            emitted = self._run(self.music_dir)
+
+        self.assertEqual(emitted["dialog"], ["Organization failed: scan broke"])
+        self.assertEqual(emitted["finish"], [])
+
+    def test_scan_skips_failing_directory(self) -> None:
+        """Test that an OSError in one directory doesn't stop the rest of the walk."""
+        broken = self.music_dir / "broken"
+        broken.mkdir()
+        (broken / "lost.mp3").write_bytes(b"")
+        (self.music_dir / "kept.mp3").write_bytes(b"")
+        real_scandir = os.scandir
+
+        def scandir(path: Any) -> Any:
+            if Path(path) == broken:
+                raise OSError(5, "Input/output error", str(path))
+            return real_scandir(path)
+
+        with patch.object(organize_thread.os, "scandir", side_effect=scandir):
+            found = list(organize_thread._scandir_recursive(str(self.music_dir)))
+
+        self.assertEqual([path.name for path in found], ["kept.mp3"])
+
+
+class TestNotificationAudioThread(unittest.TestCase):
+    """Test cases for NotificationAudioThread playback and completion reporting."""
+
+    def setUp(self) -> None:
+        """Set up test environment."""
+        self.finished: List[str] = []
+
+    def _player(self, audio_file_name: str) -> NotificationAudioThread:
+        """Create a player that records its completion signals."""
+        player = NotificationAudioThread(audio_file_name)
+        player.kill_thread_signal.connect(self.finished.append)
+        return player
+
+    def test_completion_follows_the_effect(self) -> None:
+        """Test that completion is reported when the effect stops playing, not after a delay."""
+        player = self._player("test_cue_stop")
+        with patch.object(player.sound_effect, "isPlaying", return_value=False):
+            player.sound_effect.playingChanged.emit()
+        self.assertEqual(self.finished, ["notification"])
+
+    def test_only_latest_cue_reports_completion(self) -> None:
+        """Test that a replaced cue no longer reports completion."""
+        player = self._player("test_cue_first")
+        first_effect = player.sound_effect
+        player.play("test_cue_second")
+        self.finished.clear()
+
+        first_effect.playingChanged.emit()
+        self.assertEqual(self.finished, [])
+
+        with patch.object(player.sound_effect, "isPlaying", return_value=False):
+            player.sound_effect.playingChanged.emit()
+        self.assertEqual(self.finished, ["notification"])
+
+    def test_sound_effect_is_loaded_once(self) -> None:
+        """Test that players of the same cue share one preloaded sound effect."""
+        with patch.object(
+            notification_audio_thread, "QSoundEffect", wraps=QSoundEffect
+        ) as mock_cls:
+            first = self._player("test_cue_shared")
+            second = self._player("test_cue_shared")
+            mock_cls.assert_called_once()
+
+        self.assertIs(first.sound_effect, second.sound_effect)
+
+    def test_sound_effect_source_is_in_audio_dir(self) -> None:
+        """Test that cues are loaded from the audio directory resolved at import."""
+        with patch.object(QSoundEffect, "setSource") as mock_set_source:
+            self._player("test_cue_path")
+
+        expected = notification_audio_thread._AUDIO_DIR / "test_cue_path.wav"
+        mock_set_source.assert_called_once_with(QUrl.fromLocalFile(str(expected)))
+
+    def test_shared_player_switches_cues(self) -> None:
+        """Test that the shared player is reused and plays whichever cue is requested."""
+        self.addCleanup(setattr, NotificationAudioThread, "_instance", None)
+        player = NotificationAudioThread.instance("test_cue_first")
+        self.assertIs(NotificationAudioThread.instance("test_cue_other"), player)
+
+        with patch.object(QSoundEffect, "play") as mock_play:
+            player.play("test_cue_second")
+            mock_play.assert_called_once()
+
+        self.assertEqual(player.audio_file_name, "test_cue_second")
+        self.assertIs(
+            player.sound_effect, notification_audio_thread._sound_effects["test_cue_second"]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
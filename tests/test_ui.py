@@ -0,0 +1,557 @@
+"""Unit tests for the Jellyfin Music Organizer windows.
+
+This module covers:
+- Error report exports of MusicErrorWindow
+- Error list and details pane of MusicErrorWindow
+- CustomDialog alert dialogs
+- DialogManager file dialogs
+- MusicOrganizer main window state
+"""
+
+import json
+import shutil
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+from unittest.mock import MagicMock, patch
+
+import openpyxl
+from PyQt5.QtCore import QCoreApplication, QEvent, QThreadPool
+from PyQt5.QtWidgets import QApplication, QFileDialog
+
+from jellyfin_music_organizer.ui.dialogs import DialogManager
+from jellyfin_music_organizer.utils import json_compat
+
+try:
+    from jellyfin_music_organizer.ui import custom_dialog, music_error_window, music_organizer
+    from jellyfin_music_organizer.ui.custom_dialog import CustomDialog
+    from jellyfin_music_organizer.ui.music_error_window import MusicErrorWindow
+    from jellyfin_music_organizer.ui.music_organizer import MusicOrganizer
+except ImportError:  # utils.notifications imports the Windows-only winreg and winsound modules
+    CustomDialog = MusicErrorWindow = MusicOrganizer = None
+
+
+def _error_files(count: int) -> List[Dict[str, Any]]:
+    """Build error entries shaped like the ones OrganizeThread reports."""
+    return [
+        {
+            "file_name": f"song{n}.mp3",
+            "error": "Artist or album data not found",
+            "artist_found": ["Artist"] if n % 2 else [],
+            "album_found": [],
+            "metadata_dict": {"TIT2": f"Title {n}", "TRCK": n},
+        }
+        for n in range(count)
+    ]
+
+
+@unittest.skipIf(MusicErrorWindow is None, "MusicErrorWindow needs the Windows audio modules")
+class TestMusicErrorWindowExport(unittest.TestCase):
+    """Test cases for MusicErrorWindow report exports."""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Create the application the window needs."""
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self) -> None:
+        """Set up test environment."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.window = MusicErrorWindow(_error_files(3))
+
+    def tearDown(self) -> None:
+        """Clean up test environment."""
+        QThreadPool.globalInstance().waitForDone()
+        self.window.deleteLater()
+        self.app.processEvents()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _finish_exports(self) -> None:
+        """Wait for pool exports and deliver their outcome signals."""
+        QThreadPool.globalInstance().waitForDone()
+        self.app.processEvents()
+
+    def _export(self, generate: Callable[[str], None], name: str) -> Path:
+        """Write a report with one of the window's generators and return its path."""
+        report = self.temp_dir / name
+        generate(str(report))
+        return report
+
+    def test_txt_report_lists_every_entry(self) -> None:
+        """Test that the text report holds each entry's details followed by a blank line."""
+        report = self._export(self.window._generate_txt_content, "report.txt")
+
+        expected = "".join(
+            self.window._format_details_text(info) + "\n\n" for info in self.window.error_files
+        )
+        self.assertEqual(report.read_text(encoding="utf-8"), expected)
+        self.assertIn("File Name: song2.mp3\n", expected)
+
+    def test_csv_report_format(self) -> None:
+        """Test that the CSV report starts with a BOM and ends lines with a bare newline."""
+        report = self._export(self.window._generate_csv_content, "report.csv")
+
+        content = report.read_bytes().decode("utf-8")
+        self.assertTrue(content.startswith("\ufeff"))
+        self.assertNotIn("\r", content)
+        lines = content[1:].split("\n")
+        self.assertEqual(len(lines), 5)
+        self.assertEqual(
+            lines[2], "song1.mp3,Artist or album data not found,Artist,None,TIT2,Title 1,TRCK,1"
+        )
+
+    def test_csv_header_covers_longest_metadata(self) -> None:
+        """Test that the CSV header has a key/value column pair per field of the longest entry."""
+        error_files = _error_files(3)
+        error_files[0]["metadata_dict"] = {}
+        error_files[2]["metadata_dict"] = {"A": 1, "B": 2, "C": 3}
+        window = MusicErrorWindow(error_files)
+        self.addCleanup(window.deleteLater)
+
+        report = self._export(window._generate_csv_content, "report.csv")
+
+        header = report.read_text(encoding="utf-8-sig").split("\n")[0]
+        self.assertEqual(
+            header,
+            "File Name,Error,Artist Found,Album Found," "Key 1,Value 1,Key 2,Value 2,Key 3,Value 3",
+        )
+
+    def test_json_report_matches_indented_dump(self) -> None:
+        """Test that the streamed JSON report equals a 2-space indented dump of all records."""
+        for has_orjson in (json_compat.HAS_ORJSON, False):
+            with self.subTest(orjson=has_orjson):
+                with patch.object(json_compat, "HAS_ORJSON", has_orjson):
+                    report = self._export(self.window._generate_json_content, "report.json")
+
+                content = report.read_text(encoding="utf-8")
+                records = json.loads(content)
+                self.assertEqual(content, json.dumps(records, indent=2, ensure_ascii=False))
+        self.assertEqual(
+            [record["filename"] for record in records], ["song0.mp3", "song1.mp3", "song2.mp3"]
+        )
+        self.assertEqual(records[1]["metadata_dict"], {"TIT2": "Title 1", "TRCK": "1"})
+
+    def test_json_report_without_entries(self) -> None:
+        """Test that an empty error list is written as an empty JSON array."""
+        self.window.error_files = []
+        report = self._export(self.window._generate_json_content, "report.json")
+
+        self.assertEqual(report.read_text(encoding="utf-8"), "[]")
+
+    def _excel_rows(self, report: Path) -> List[Any]:
+        """Read every row of an exported workbook's only sheet."""
+        workbook = openpyxl.load_workbook(report, read_only=True)
+        self.addCleanup(workbook.close)
+        return list(workbook.active.iter_rows(values_only=True))
+
+    def test_excel_report_is_written_in_write_only_mode(self) -> None:
+        """Test that the Excel report is streamed through a write-only workbook."""
+        with patch("openpyxl.Workbook", wraps=openpyxl.Workbook) as mock_workbook:
+            report = self._export(self.window._generate_excel_content, "report.xlsx")
+            mock_workbook.assert_called_once_with(write_only=True)
+
+        rows = self._excel_rows(report)
+        self.assertEqual(
+            rows[0], ("Filename", "Error", "Artist Found", "Album Found", "TIT2", "TRCK")
+        )
+        self.assertEqual(
+            rows[2],
+            ("song1.mp3", "Artist or album data not found", "Artist", "None", "Title 1", "1"),
+        )
+        self.assertEqual(len(rows), 4)
+
+    def test_excel_cells_align_with_header_keys(self) -> None:
+        """Test that each metadata value lands under its key's column, blank when missing."""
+        error_files = _error_files(2)
+        error_files[0]["metadata_dict"] = {"TRCK": 4, "COMM": None}
+        error_files[1]["metadata_dict"] = {"TIT2": "Title", "COMM": "Note"}
+        window = MusicErrorWindow(error_files)
+        self.addCleanup(window.deleteLater)
+
+        rows = self._excel_rows(self._export(window._generate_excel_content, "report.xlsx"))
+
+        self.assertEqual(rows[0][4:], ("COMM", "TIT2", "TRCK"))
+        # write-only sheets store empty strings as empty cells
+        self.assertEqual(rows[1][4:], (None, None, "4"))
+        self.assertEqual(rows[2][4:], ("Note", "Title", None))
+
+    def test_uniform_excel_rows_match_general_rows(self) -> None:
+        """Test that the itemgetter path for uniform metadata gives the same rows."""
+        max_len, keys, uniform = self.window._metadata_summary()
+        self.assertTrue(uniform)
+
+        fast_rows = list(self.window._generate_excel_rows((max_len, keys, True)))
+        general_rows = list(self.window._generate_excel_rows((max_len, keys, False)))
+
+        self.assertEqual(fast_rows, general_rows)
+        self.assertEqual(fast_rows[2][4:], ["Title 2", "2"])
+
+    def test_metadata_summary_single_pass(self) -> None:
+        """Test that the field count and key union come from one cached pass."""
+        error_files = _error_files(2)
+        error_files[1]["metadata_dict"] = {"COMM": "Note", "TIT2": "Title", "TPOS": 1}
+        window = MusicErrorWindow(error_files)
+        self.addCleanup(window.deleteLater)
+
+        summary = window._metadata_summary()
+        self.assertEqual(summary, (3, ["COMM", "TIT2", "TPOS", "TRCK"], False))
+        self.assertIs(window._metadata_summary(), summary)
+
+        window.error_files = []
+        window._meta_summary_cache = None
+        self.assertEqual(window._metadata_summary()[:2], (0, []))
+
+    def test_missing_matches_export_as_none(self) -> None:
+        """Test that every export writes "None" for an artist or album that wasn't found."""
+        info = self.window.error_files[0]
+
+        self.assertEqual(self.window._process_csv_row(info)[2:4], ["None", "None"])
+        json_data = self.window._process_json_data(info)
+        self.assertEqual((json_data["artist_found"], json_data["album_found"]), ("None", "None"))
+        self.assertIn("Artist Found: False\n", self.window._details_cache[0])
+
+    def test_caller_entries_are_not_modified(self) -> None:
+        """Test that the export values are stored on the window's copies of the entries."""
+        error_files = _error_files(2)
+        window = MusicErrorWindow(error_files)
+        self.addCleanup(window.deleteLater)
+
+        self.assertEqual(error_files, _error_files(2))
+        self.assertEqual(window.error_files[1]["_artist0"], "Artist")
+
+    def test_metadata_values_are_formatted_in_one_pass(self) -> None:
+        """Test that metadata values are stringified once and None values dropped."""
+        formatted = self.window._format_metadata({"TRCK": 3, "COMM": None, 7: ["a"]})
+
+        self.assertEqual(formatted, {"TRCK": "3", "7": "['a']"})
+        self.assertEqual(self.window._format_metadata("not a dict"), {})
+
+    def test_excel_save_failure_is_reported(self) -> None:
+        """Test that a failed workbook save takes the failure path."""
+        report = self.temp_dir / "report.xlsx"
+        save = openpyxl.Workbook.save
+
+        def fail_after_writing(workbook: Any, file_name: str) -> None:
+            # Finishing a real save closes the write-only sheet's row stream
+            save(workbook, str(self.temp_dir / "discarded.xlsx"))
+            raise OSError("disk full")
+
+        with patch.object(self.window, "_get_save_filename", return_value=str(report)):
+            with patch("openpyxl.Workbook.save", autospec=True, side_effect=fail_after_writing):
+                self.window.generateExcel()
+                self._finish_exports()
+
+        self.assertEqual(self.window.excel_button.text(), "Excel Generation Failed!")
+        self.assertFalse(report.exists())
+
+    def test_metadata_summary_is_computed_on_gui_thread(self) -> None:
+        """Test that the export task doesn't compute the metadata summary itself."""
+        threads = []
+        summary = self.window._metadata_summary
+
+        def record_thread() -> Any:
+            threads.append(threading.current_thread())
+            return summary()
+
+        report = self.temp_dir / "report.xlsx"
+        with patch.object(self.window, "_metadata_summary", side_effect=record_thread):
+            with patch.object(self.window, "_get_save_filename", return_value=str(report)):
+                self.window.generateExcel()
+            self._finish_exports()
+
+        self.assertEqual(self.window.excel_button.text(), "Excel File Generated!")
+        self.assertTrue(report.exists())
+        self.assertEqual(set(threads), {threading.main_thread()})
+
+
+@unittest.skipIf(MusicErrorWindow is None, "MusicErrorWindow needs the Windows audio modules")
+class TestMusicErrorWindowDetails(unittest.TestCase):
+    """Test cases for the MusicErrorWindow error list and details pane."""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Create the application the window needs."""
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self) -> None:
+        """Set up test environment."""
+        self.window = MusicErrorWindow(_error_files(3))
+        self.app.processEvents()
+
+    def tearDown(self) -> None:
+        """Clean up test environment."""
+        self.window.deleteLater()
+        self.app.processEvents()
+
+    def _select(self, row: int) -> None:
+        """Select a row of the error list view."""
+        self.window.file_list_view.setCurrentIndex(self.window.file_list_model.index(row))
+
+    def test_list_model_serves_file_names(self) -> None:
+        """Test that the list view shows one row per entry, with the first row selected."""
+        model = self.window.file_list_model
+
+        self.assertEqual(model.rowCount(), 3)
+        self.assertEqual(model.data(model.index(1)), "song1.mp3")
+        self.assertEqual(self.window.file_list_view.currentIndex().row(), 0)
+        self.assertTrue(
+            self.window.details_display.toPlainText().startswith("File Name: song0.mp3")
+        )
+
+    def test_selection_reads_entry_by_row(self) -> None:
+        """Test that selecting a row shows that entry without searching by file name."""
+        self.window.error_files[2]["file_name"] = self.window.error_files[0]["file_name"]
+        self._select(2)
+        self.app.processEvents()
+
+        self.assertEqual(self.window.details_display.toPlainText(), self.window._details_cache[2])
+        self.assertIn("TIT2: Title 2", self.window.details_display.toPlainText())
+
+    def test_details_text_is_formatted_once(self) -> None:
+        """Test that each entry's details are formatted at construction, not on selection."""
+        self.assertEqual(
+            self.window._details_cache[1],
+            "File Name: song1.mp3\n"
+            "Error: Artist or album data not found\n"
+            "Artist Found: Artist\n"
+            "Album Found: False\n\n"
+            "Metadata:\nTIT2: Title 1\nTRCK: 1",
+        )
+        with patch.object(self.window, "_format_details_text") as mock_format:
+            self._select(1)
+            self.app.processEvents()
+            mock_format.assert_not_called()
+
+        self.assertEqual(self.window.details_display.toPlainText(), self.window._details_cache[1])
+
+    def test_rapid_selection_renders_last_row_once(self) -> None:
+        """Test that selections made in one event-loop pass render only the last row."""
+        display = self.window.details_display
+        with patch.object(display, "setDocument", wraps=display.setDocument) as mock_set:
+            self._select(1)
+            self._select(2)
+            mock_set.assert_not_called()
+
+            self.app.processEvents()
+            mock_set.assert_called_once()
+
+        self.assertEqual(display.toPlainText(), self.window._details_cache[2])
+
+    def test_recent_details_documents_are_reused(self) -> None:
+        """Test that re-selecting a row swaps its cached document back in, up to the LRU size."""
+        first_doc = self.window.details_display.document()
+        self._select(1)
+        self.app.processEvents()
+        self._select(0)
+        self.app.processEvents()
+        self.assertIs(self.window.details_display.document(), first_doc)
+
+        with patch.object(music_error_window, "_DOC_CACHE_SIZE", 2):
+            self._select(2)
+            self.app.processEvents()
+
+        self.assertEqual(list(self.window._doc_cache), [0, 2])
+
+    def test_copy_uses_cached_clipboard(self) -> None:
+        """Test that copying the details uses the clipboard looked up at construction."""
+        with patch.object(QApplication, "clipboard") as mock_clipboard:
+            self.window.copyDetails()
+            mock_clipboard.assert_not_called()
+
+        self.assertEqual(QApplication.clipboard().text(), self.window._details_cache[0])
+        self.assertEqual(self.window.copy_button.text(), "Success")
+
+    def _closed_window(self, exports_running: int = 0) -> Tuple[Any, List[bool]]:
+        """Close a new window and return it with a list that records its destruction."""
+        window = MusicErrorWindow(_error_files(2))
+        destroyed: List[bool] = []
+        window.destroyed.connect(lambda: destroyed.append(True))
+        window._exports_running = exports_running
+        window.close()
+        return window, destroyed
+
+    def _deliver_deletes(self) -> None:
+        """Run pending deleteLater calls."""
+        QCoreApplication.sendPostedEvents(None, QEvent.DeferredDelete)
+
+    def test_close_releases_data_and_deletes_window(self) -> None:
+        """Test that closing the window drops its entries and destroys it."""
+        window, destroyed = self._closed_window()
+
+        self.assertEqual(window.error_files, [])
+        self.assertEqual(window._details_cache, [])
+        self.assertEqual(window.file_list_model.rowCount(), 0)
+        self._deliver_deletes()
+        self.assertEqual(destroyed, [True])
+
+    def test_close_waits_for_running_export(self) -> None:
+        """Test that a window closed during an export is kept until the export reports back."""
+        window, destroyed = self._closed_window(exports_running=1)
+
+        self._deliver_deletes()
+        self.assertEqual(destroyed, [])
+        self.assertEqual(len(window.error_files), 2)
+
+        window._on_export_done("report.csv")
+        self._deliver_deletes()
+        self.assertEqual(destroyed, [True])
+
+
+@unittest.skipIf(CustomDialog is None, "CustomDialog needs the Windows audio modules")
+class TestCustomDialog(unittest.TestCase):
+    """Test cases for the CustomDialog alert dialog."""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Create the application the dialog needs."""
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self) -> None:
+        """Set up test environment."""
+        self.settings = {"version": "3.06", "mute_sound": False}
+        self.mock_config = MagicMock()
+        self.mock_config.return_value.load.return_value = self.settings
+        patcher = patch.object(custom_dialog, "ConfigManager", self.mock_config)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        custom_dialog._config_manager.cache_clear()
+        self.addCleanup(custom_dialog._config_manager.cache_clear)
+
+    def _show(self, dialog: Any) -> None:
+        """Show a dialog and close it once the test is done."""
+        dialog.show()
+        self.addCleanup(dialog.deleteLater)
+        self.addCleanup(dialog.close)
+
+    def test_muted_dialog_creates_no_notification_manager(self) -> None:
+        """Test that the notification manager is only created when a sound plays."""
+        self.settings["mute_sound"] = True
+        with patch.object(custom_dialog, "NotificationManager") as mock_manager:
+            self._show(CustomDialog("Muted"))
+            mock_manager.assert_not_called()
+
+            self.settings["mute_sound"] = False
+            self._show(CustomDialog("Unmuted"))
+            mock_manager.assert_called_once_with()
+            mock_manager.return_value.play_notification.assert_called_once_with("default")
+
+    def test_dialogs_share_one_config_manager(self) -> None:
+        """Test that every dialog uses the same ConfigManager instead of building its own."""
+        self.settings["mute_sound"] = True
+        first = CustomDialog("First")
+        second = CustomDialog("Second")
+        self.addCleanup(first.deleteLater)
+        self.addCleanup(second.deleteLater)
+
+        self.mock_config.assert_called_once_with()
+        self.assertIs(first.config_manager, second.config_manager)
+        self.assertEqual(second.windowTitle(), "Alert v3.06")
+
+
+class TestDialogManager(unittest.TestCase):
+    """Test cases for DialogManager file dialogs."""
+
+    def _save_file(self, chosen: str, default_suffix: str) -> Tuple[Any, str]:
+        """Run get_save_file with the dialog returning the given file name."""
+        with patch.object(QFileDialog, "getSaveFileName", return_value=(chosen, "CSV (*.csv)")):
+            return DialogManager.get_save_file(None, "Save", "CSV (*.csv)", default_suffix)
+
+    def test_default_suffix_is_appended(self) -> None:
+        """Test that a name without an extension gets the default suffix, dot or not."""
+        for default_suffix in (".csv", "csv"):
+            with self.subTest(default_suffix=default_suffix):
+                self.assertEqual(
+                    self._save_file("/music/report", default_suffix),
+                    (Path("/music/report.csv"), "CSV (*.csv)"),
+                )
+
+    def test_existing_suffix_is_kept(self) -> None:
+        """Test that a chosen extension is kept and a cancelled dialog returns None."""
+        self.assertEqual(self._save_file("/music/report.txt", ".csv")[0], Path("/music/report.txt"))
+        self.assertEqual(self._save_file("", ".csv"), (None, ""))
+
+
+@unittest.skipIf(MusicOrganizer is None, "MusicOrganizer needs the Windows audio modules")
+class TestMusicOrganizer(unittest.TestCase):
+    """Test cases for the MusicOrganizer main window."""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Create the application the window needs."""
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self) -> None:
+        """Set up a window whose settings and managers don't touch the real config."""
+        self.settings_data: Dict[str, Any] = {}
+        for name in ("WindowManager", "NotificationManager", "ConfigManager"):
+            patcher = patch.object(music_organizer, name)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        music_organizer.ConfigManager.return_value.load.return_value = {"mute_sound": True}
+        patcher = patch.object(music_organizer, "get_settings", side_effect=self._get_settings)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.window = MusicOrganizer()
+
+    def tearDown(self) -> None:
+        """Clean up test environment."""
+        self.window.deleteLater()
+        self.app.processEvents()
+
+    def _get_settings(self) -> Dict[str, Any]:
+        """Return the settings the test set up."""
+        return dict(self.settings_data)
+
+    def test_organize_enabled_only_with_both_folders(self) -> None:
+        """Test that the organize button follows whether both folder paths are set."""
+        self.assertFalse(self.window.organize_button.isEnabled())
+
+        self.settings_data["music_folder_path"] = "/music"
+        self.window.load_settings()
+        self.assertFalse(self.window.organize_button.isEnabled())
+
+        self.settings_data["destination_folder_path"] = "/library"
+        self.window.load_settings()
+        self.assertTrue(self.window.organize_button.isEnabled())
+
+    def test_progress_repaints_are_throttled(self) -> None:
+        """Test that updates within the throttle interval collapse into the latest value."""
+        bar = self.window.music_progress_bar
+        with patch.object(bar, "setValue", wraps=bar.setValue) as mock_set:
+            for value in (10, 20, 30):
+                self.window.music_progress(value)
+            mock_set.assert_called_once_with(10)
+
+            self.window._progress_timer.timeout.emit()
+            self.assertEqual(bar.value(), 30)
+            self.assertIsNone(self.window._progress_pending)
+
+    def test_reset_drops_pending_progress(self) -> None:
+        """Test that a held-back progress value can't overwrite a reset."""
+        self.window.music_progress(10)
+        self.window.music_progress(100)
+        self.window.reset_progress_songs_label()
+
+        self.window._progress_timer.timeout.emit()
+        self.assertEqual(self.window.music_progress_bar.value(), 0)
+
+    def test_reset_skips_state_that_is_already_reset(self) -> None:
+        """Test that resetting an idle bar makes no Qt calls and a full bar gets its style back."""
+        bar = self.window.music_progress_bar
+        with patch.object(bar, "setValue") as mock_value:
+            with patch.object(bar, "setStyleSheet") as mock_style:
+                self.window.reset_progress_songs_label()
+        mock_value.assert_not_called()
+        mock_style.assert_not_called()
+
+        self.window.music_progress(100)
+        self.assertEqual(bar.styleSheet(), self.window._PROGRESS_FULL_QSS)
+        self.window.reset_progress_songs_label()
+        self.assertEqual((bar.value(), bar.styleSheet()), (0, self.window._PROGRESS_EMPTY_QSS))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,6 +2,8 @@
 
 This module provides comprehensive testing for core utilities including:
 - Configuration management
+- Metadata extraction
+- File operations
 - Resource handling
 - Progress tracking
 - Thread management
@@ -9,8 +11,10 @@ This module provides comprehensive testing for core utilities including:
 """
 
 import contextlib
+import os
 import platform
 import shutil
+import sys
 import tempfile
 import threading
 import time
@@ -20,9 +24,15 @@ from typing import Any, Dict, Generator, Optional, Type, TypeVar
 from unittest.mock import MagicMock, patch
 
 import pytest
+from mutagen.id3 import APIC, ID3, TALB, TIT2, TPE1
+from mutagen.mp3 import MP3
 
+from jellyfin_music_organizer.utils import config as utils_config
+from jellyfin_music_organizer.utils import file_ops, metadata
 from jellyfin_music_organizer.utils.config import ConfigManager
+from jellyfin_music_organizer.utils.constants import Paths
 from jellyfin_music_organizer.utils.exceptions import FileOperationError
+from jellyfin_music_organizer.utils.file_ops import FileOperations
 from jellyfin_music_organizer.utils.progress import ProgressInfo, ProgressTracker
 from jellyfin_music_organizer.utils.resources import ResourceManager
 from jellyfin_music_organizer.utils.threads import ThreadManager
@@ -152,6 +162,197 @@ class TestConfigManager(unittest.TestCase):
             self.assertTrue(platform_config.get("use_native_dialogs"))
 
 
+class TestConfigManagerReload(unittest.TestCase):
+    """Test cases for ConfigManager re-reading a changed configuration file."""
+
+    def setUp(self) -> None:
+        """Set up test environment."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.config_path = Path(self.temp_dir) / "test_config.json"
+
+    def tearDown(self) -> None:
+        """Clean up test environment."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_load_sees_save_from_other_manager(self) -> None:
+        """Test that load() picks up a file written by another manager."""
+        reader = ConfigManager(self.config_path)
+        self.assertFalse(reader.load()["mute_sound"])
+
+        ConfigManager(self.config_path).save({"mute_sound": True})
+        self.assertTrue(reader.load()["mute_sound"])
+
+    def test_unchanged_file_is_not_reread(self) -> None:
+        """Test that load() skips parsing while the file is unchanged."""
+        manager = ConfigManager(self.config_path)
+        manager.save({"mute_sound": True})
+        with patch("jellyfin_music_organizer.utils.config.json.load") as mock_load:
+            manager.load()
+            mock_load.assert_not_called()
+
+
+class TestGetSettings(unittest.TestCase):
+    """Test cases for the shared settings file cache."""
+
+    def setUp(self) -> None:
+        """Set up test environment."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.settings_path = Path(self.temp_dir) / "settings_jmo.json"
+        patcher = patch.object(Paths, "CONFIG_FILE", self.settings_path)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        utils_config._load_settings_cached.cache_clear()
+        self.addCleanup(utils_config._load_settings_cached.cache_clear)
+
+    def tearDown(self) -> None:
+        """Clean up test environment."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_missing_file_gives_empty_settings(self) -> None:
+        """Test that no settings file reads as empty settings."""
+        self.assertEqual(utils_config.get_settings(), {})
+
+    def test_unchanged_file_is_parsed_once(self) -> None:
+        """Test that repeated reads of an unchanged file share one parse."""
+        self.settings_path.write_text('{"mute_sound": true}')
+        with patch.object(
+            utils_config.json_compat, "loads", wraps=utils_config.json_compat.loads
+        ) as mock_loads:
+            self.assertEqual(utils_config.get_settings(), {"mute_sound": True})
+            self.assertEqual(utils_config.get_settings(), {"mute_sound": True})
+            mock_loads.assert_called_once()
+
+    def test_changed_file_is_parsed_again(self) -> None:
+        """Test that a rewritten settings file is picked up by the next read."""
+        self.settings_path.write_text('{"mute_sound": true}')
+        self.assertTrue(utils_config.get_settings()["mute_sound"])
+
+        self.settings_path.write_text('{"mute_sound": false}')
+        self.assertFalse(utils_config.get_settings()["mute_sound"])
+
+    def test_returned_settings_are_independent(self) -> None:
+        """Test that editing returned nested values doesn't change the cached parse."""
+        self.settings_path.write_text('{"window_state": {"main": {"x": 1}}}')
+        utils_config.get_settings()["window_state"]["main"]["x"] = 2
+
+        self.assertEqual(utils_config.get_settings()["window_state"], {"main": {"x": 1}})
+
+
+class TestExtractMetadata(unittest.TestCase):
+    """Test cases for metadata extraction."""
+
+    # One silent MPEG-1 Layer III frame (128 kbit/s, 44.1 kHz)
+    MPEG_FRAME = b"\xff\xfb\x90\x64" + b"\x00" * 413
+
+    def setUp(self) -> None:
+        """Set up test environment."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+
+    def tearDown(self) -> None:
+        """Clean up test environment."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _write_mp3(self, name: str, *frames: Any) -> Path:
+        """Write a short MP3 file with the given ID3 frames."""
+        path = self.temp_dir / name
+        path.write_bytes(self.MPEG_FRAME * 20)
+        tags = ID3()
+        for frame in frames:
+            tags.add(frame)
+        tags.save(path)
+        return path
+
+    def test_mp3_fast_path_matches_full_parse(self) -> None:
+        """Test that the ID3-only read returns the same keys and values as a full parse."""
+        frames = (
+            TPE1(encoding=3, text=["Artist"]),
+            TALB(encoding=3, text=["Album"]),
+            TIT2(encoding=3, text=["Title"]),
+            APIC(encoding=3, mime="image/png", type=3, desc="cover", data=b"\x89PNG"),
+        )
+        fast = metadata.extract_metadata(str(self._write_mp3("song.mp3", *frames)))
+        # .mp2 files are opened by the same MP3 parser, without the fast path
+        full = metadata.extract_metadata(str(self._write_mp3("song.mp2", *frames)))
+
+        self.assertEqual(set(fast), {"TPE1", "TALB"})
+        self.assertEqual(set(fast), set(full))
+        self.assertEqual({k: str(v) for k, v in fast.items()}, {k: str(v) for k, v in full.items()})
+
+    def test_mp3_without_name_frames_is_parsed_once(self) -> None:
+        """Test that an ID3 tag lacking artist and album isn't parsed a second time."""
+        path = self._write_mp3("untitled.mp3", TIT2(encoding=3, text=["Title"]))
+        with patch.object(metadata, "open_audio") as mock_open:
+            self.assertEqual(metadata.extract_metadata(str(path)), {})
+            mock_open.assert_not_called()
+
+    def test_known_extension_skips_format_sniffing(self) -> None:
+        """Test that a file is opened with its extension's parser without probing every format."""
+        path = self._write_mp3("song.mp2", TPE1(encoding=3, text=["Artist"]))
+        with patch.object(metadata.mutagen, "File") as mock_file:
+            audio = metadata.open_audio(str(path))
+            mock_file.assert_not_called()
+
+        self.assertIsInstance(audio, MP3)
+
+    def test_mismatched_content_falls_back_to_sniffing(self) -> None:
+        """Test that content the extension's parser rejects is still identified."""
+        path = self._write_mp3("song.ogg", TPE1(encoding=3, text=["Artist"]))
+
+        self.assertIsInstance(metadata.open_audio(str(path)), MP3)
+
+
+class TestFileOperations(unittest.TestCase):
+    """Test cases for file operation helpers."""
+
+    def setUp(self) -> None:
+        """Set up test environment."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+
+    def tearDown(self) -> None:
+        """Clean up test environment."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_get_music_files_single_walk(self) -> None:
+        """Test that music files at any depth are found, whatever the extension case."""
+        album_dir = self.temp_dir / "Artist" / "Album"
+        album_dir.mkdir(parents=True)
+        for path in (self.temp_dir / "a.mp3", album_dir / "b.FLAC", album_dir / "cover.jpg"):
+            path.write_bytes(b"")
+        # A directory named like a music file isn't a file
+        (self.temp_dir / "folder.mp3").mkdir()
+
+        found = file_ops.get_music_files(str(self.temp_dir))
+
+        self.assertEqual(sorted(path.name for path in found), ["a.mp3", "b.FLAC"])
+
+    def _copy(self) -> Path:
+        """Copy a source file with an old modification time and return the destination."""
+        source = self.temp_dir / "source.mp3"
+        source.write_bytes(b"audio" * 1000)
+        os.utime(source, (1_000_000_000, 1_000_000_000))
+        destination = self.temp_dir / "organized" / "copy.mp3"
+        FileOperations.safe_copy(source, destination)
+        return destination
+
+    @unittest.skipUnless(sys.platform.startswith("linux"), "kernel copies are Linux-only")
+    def test_safe_copy_in_kernel(self) -> None:
+        """Test that Linux copies skip shutil and keep the data and modification time."""
+        with patch.object(file_ops.shutil, "copy2") as mock_copy2:
+            destination = self._copy()
+            mock_copy2.assert_not_called()
+
+        self.assertEqual(destination.read_bytes(), b"audio" * 1000)
+        self.assertEqual(destination.stat().st_mtime, 1_000_000_000)
+
+    def test_safe_copy_falls_back_to_shutil(self) -> None:
+        """Test that a failed kernel copy leaves the copy to shutil."""
+        with patch.object(file_ops, "_kernel_copy", return_value=False):
+            destination = self._copy()
+
+        self.assertEqual(destination.read_bytes(), b"audio" * 1000)
+        self.assertEqual(destination.stat().st_mtime, 1_000_000_000)
+
+
 class TestResourceManager(unittest.TestCase):
     """Test cases for ResourceManager."""
 